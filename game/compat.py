@@ -0,0 +1,9 @@
+"""
+Compatibility helpers shared by the game modules
+"""
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get plain
+# classes. Use as @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
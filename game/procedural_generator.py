@@ -7,8 +7,9 @@ Creates infinite, dynamic content including sectors, planets, events, and NPCs
 import random
 import math
 import json
+import threading
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, Iterable, List, Tuple, Optional, Any
 from enum import Enum
 
 
@@ -94,6 +95,11 @@ class ProceduralGenerator:
         self.seed = seed or random.randint(1, 1000000)
         random.seed(self.seed)
 
+        # Sector builds draw from their own seeded RNG, one per thread, so
+        # concurrent builds (and other users of the global RNG) can't
+        # interleave and change what a sector ID generates
+        self._local = threading.local()
+
         # Name generation lists
         self.planet_prefixes = [
             "Alpha",
@@ -238,19 +244,47 @@ class ProceduralGenerator:
             "Explorers",
         ]
 
+    @property
+    def _rng(self):
+        """RNG of the sector being built on this thread, else the global one"""
+        return getattr(self._local, "rng", random)
+
     def generate_galaxy_sector(
         self, sector_id: int, force_regenerate: bool = False
     ) -> ProceduralSector:
         """Generate a complete sector with planets, stations, and events"""
+        return self._build_sector(sector_id)
+
+    def generate_galaxy_sectors(self, sector_ids: Iterable[int]) -> Dict[int, ProceduralSector]:
+        """Generate several sectors at once, keyed by sector ID
+
+        Each sector is still seeded from its own ID, so the results match
+        generate_galaxy_sector().
+        """
+        build = self._build_sector
+        sectors: Dict[int, ProceduralSector] = {}
+        for sector_id in sector_ids:
+            if sector_id not in sectors:
+                sectors[sector_id] = build(sector_id)
+        return sectors
+
+    def _build_sector(self, sector_id: int) -> ProceduralSector:
+        """Generate one sector from its own seeded RNG"""
         # Use sector ID to create consistent seed for this sector
-        sector_seed = self.seed + sector_id * 1000
-        random.seed(sector_seed)
+        self._local.rng = random.Random(self.seed + sector_id * 1000)
+        try:
+            return self._assemble_sector(sector_id)
+        finally:
+            del self._local.rng
+
+    def _assemble_sector(self, sector_id: int) -> ProceduralSector:
+        """Generate a sector's contents from the current thread's sector RNG"""
 
         # Calculate coordinates based on sector ID
         coords = self._calculate_sector_coordinates(sector_id)
 
         # Generate sector name
-        name = f"{random.choice(self.sector_names)} {sector_id}"
+        name = f"{self._rng.choice(self.sector_names)} {sector_id}"
 
         # Determine faction control based on coordinates
         faction = self._determine_sector_faction(coords)
@@ -259,7 +293,7 @@ class ProceduralGenerator:
         danger_level = self._calculate_danger_level(coords)
 
         # Generate planets
-        num_planets = random.randint(0, 5)
+        num_planets = self._rng.randint(0, 5)
         planets = []
         for i in range(num_planets):
             planet = self._generate_planet(sector_id, i)
@@ -283,9 +317,6 @@ class ProceduralGenerator:
         # Generate sector resources
         resources = self._generate_sector_resources(coords, danger_level)
 
-        # Reset random seed
-        random.seed(self.seed)
-
         # Build narrative
         narrative_summary, narrative_hooks = self._generate_sector_narrative(
             name, faction, danger_level, planets, stations, events, stellar_objects
@@ -381,29 +412,29 @@ class ProceduralGenerator:
         if distance <= 2:
             return "Federation"
         elif distance <= 4:
-            return random.choice(["Federation", "Republic", "Alliance"])
+            return self._rng.choice(["Federation", "Republic", "Alliance"])
         elif distance <= 8:
-            return random.choice(["Empire", "Consortium", "Independent", "Neutral"])
+            return self._rng.choice(["Empire", "Consortium", "Independent", "Neutral"])
         else:
-            return random.choice(["Pirates", "Rebels", "Independent", "Unknown"])
+            return self._rng.choice(["Pirates", "Rebels", "Independent", "Unknown"])
 
     def _calculate_danger_level(self, coords: Tuple[int, int]) -> int:
         """Calculate danger level based on distance from center"""
         x, y = coords
         distance = math.sqrt(x * x + y * y)
         base_danger = min(int(distance), 10)
-        return max(1, base_danger + random.randint(-2, 3))
+        return max(1, base_danger + self._rng.randint(-2, 3))
 
     def _generate_planet(self, sector_id: int, planet_index: int) -> ProceduralPlanet:
         """Generate a single planet"""
         # Generate name
-        name = f"{random.choice(self.planet_prefixes)} {random.choice(self.planet_suffixes)} {chr(65 + planet_index)}"
+        name = f"{self._rng.choice(self.planet_prefixes)} {self._rng.choice(self.planet_suffixes)} {chr(65 + planet_index)}"
 
         # Select biome
-        biome = random.choice(list(BiomeType))
+        biome = self._rng.choice(list(BiomeType))
 
         # Generate size
-        size = random.choices(["small", "medium", "large", "massive"], weights=[40, 35, 20, 5])[0]
+        size = self._rng.choices(["small", "medium", "large", "massive"], weights=[40, 35, 20, 5])[0]
 
         # Generate population based on biome and size
         size_multiplier = {"small": 1, "medium": 3, "large": 8, "massive": 20}[size]
@@ -419,10 +450,10 @@ class ProceduralGenerator:
             BiomeType.ENERGY: 0.2,
         }[biome]
 
-        population = int(random.randint(1000, 50000) * size_multiplier * biome_multiplier)
+        population = int(self._rng.randint(1000, 50000) * size_multiplier * biome_multiplier)
 
         # Tech level (1-10)
-        tech_level = max(1, min(10, random.randint(1, 8) + random.randint(-2, 3)))
+        tech_level = max(1, min(10, self._rng.randint(1, 8) + self._rng.randint(-2, 3)))
 
         # Generate resources based on biome
         resources = self._generate_planet_resources(biome, size)
@@ -431,7 +462,7 @@ class ProceduralGenerator:
         atmosphere = self._generate_atmosphere(biome)
 
         # Gravity (0.5x to 3.0x Earth)
-        gravity = round(random.uniform(0.5, 3.0), 1)
+        gravity = round(self._rng.uniform(0.5, 3.0), 1)
 
         # Temperature (-200 to 500 Celsius)
         temp_ranges = {
@@ -446,7 +477,7 @@ class ProceduralGenerator:
             BiomeType.ENERGY: (100, 500),
         }
         temp_range = temp_ranges[biome]
-        temperature = random.randint(temp_range[0], temp_range[1])
+        temperature = self._rng.randint(temp_range[0], temp_range[1])
 
         # Special features
         special_features = self._generate_special_features(biome, tech_level)
@@ -455,7 +486,7 @@ class ProceduralGenerator:
         trade_goods = self._generate_planet_trade_goods(biome, tech_level, resources)
 
         # Faction control
-        faction_control = random.choice(self.factions)
+        faction_control = self._rng.choice(self.factions)
 
         return ProceduralPlanet(
             name=name,
@@ -478,8 +509,8 @@ class ProceduralGenerator:
         size_multiplier = {"small": 1, "medium": 2, "large": 4, "massive": 8}[size]
 
         # Common resources
-        for resource in random.sample(self.common_resources, random.randint(2, 5)):
-            resources[resource] = random.randint(100, 1000) * size_multiplier
+        for resource in self._rng.sample(self.common_resources, self._rng.randint(2, 5)):
+            resources[resource] = self._rng.randint(100, 1000) * size_multiplier
 
         # Rare resources based on biome
         biome_rares = {
@@ -492,8 +523,8 @@ class ProceduralGenerator:
 
         if biome in biome_rares:
             for rare in biome_rares[biome]:
-                if random.random() < 0.3:  # 30% chance
-                    resources[rare] = random.randint(10, 100) * size_multiplier
+                if self._rng.random() < 0.3:  # 30% chance
+                    resources[rare] = self._rng.randint(10, 100) * size_multiplier
 
         return resources
 
@@ -510,7 +541,7 @@ class ProceduralGenerator:
             BiomeType.CRYSTAL: ["Crystalline", "Mineral", "Stable"],
             BiomeType.ENERGY: ["Energized", "Plasma", "Unstable"],
         }
-        return random.choice(atmospheres[biome])
+        return self._rng.choice(atmospheres[biome])
 
     def _generate_special_features(self, biome: BiomeType, tech_level: int) -> List[str]:
         """Generate special planetary features"""
@@ -526,12 +557,12 @@ class ProceduralGenerator:
         }
 
         if biome in biome_features:
-            features.extend(random.sample(biome_features[biome], random.randint(1, 2)))
+            features.extend(self._rng.sample(biome_features[biome], self._rng.randint(1, 2)))
 
         # Tech-level features
         if tech_level >= 7:
             tech_features = ["Orbital Platforms", "Planetary Shield", "Space Elevator"]
-            features.extend(random.sample(tech_features, random.randint(0, 2)))
+            features.extend(self._rng.sample(tech_features, self._rng.randint(0, 2)))
 
         return features
 
@@ -557,15 +588,15 @@ class ProceduralGenerator:
         }
 
         if biome in biome_goods:
-            goods.extend(random.sample(biome_goods[biome], random.randint(1, 3)))
+            goods.extend(self._rng.sample(biome_goods[biome], self._rng.randint(1, 3)))
 
         # Add tech-based goods
         if tech_level >= 5:
             goods.extend(
-                random.sample(["Electronics", "Software", "Machinery"], random.randint(1, 2))
+                self._rng.sample(["Electronics", "Software", "Machinery"], self._rng.randint(1, 2))
             )
         if tech_level >= 8:
-            goods.extend(random.sample(["Advanced Technology", "AI Systems"], random.randint(0, 1)))
+            goods.extend(self._rng.sample(["Advanced Technology", "AI Systems"], self._rng.randint(0, 1)))
 
         return list(set(goods))  # Remove duplicates
 
@@ -574,7 +605,7 @@ class ProceduralGenerator:
         stations = []
 
         # At least one station per sector
-        num_stations = max(1, random.randint(0, 3) + (num_planets // 2))
+        num_stations = max(1, self._rng.randint(0, 3) + (num_planets // 2))
 
         station_types = [
             "Trade Station",
@@ -588,13 +619,13 @@ class ProceduralGenerator:
 
         for i in range(num_stations):
             station = {
-                "name": f"{faction} {random.choice(station_types)} {sector_id}-{i+1}",
-                "type": random.choice(station_types),
+                "name": f"{faction} {self._rng.choice(station_types)} {sector_id}-{i+1}",
+                "type": self._rng.choice(station_types),
                 "faction": faction,
-                "size": random.choice(["Small", "Medium", "Large"]),
+                "size": self._rng.choice(["Small", "Medium", "Large"]),
                 "services": self._generate_station_services(),
-                "population": random.randint(100, 5000),
-                "docking_fee": random.randint(10, 100),
+                "population": self._rng.randint(100, 5000),
+                "docking_fee": self._rng.randint(10, 100),
             }
             stations.append(station)
 
@@ -613,17 +644,17 @@ class ProceduralGenerator:
             "Entertainment",
             "Security",
         ]
-        return random.sample(all_services, random.randint(3, 7))
+        return self._rng.sample(all_services, self._rng.randint(3, 7))
 
     def _generate_sector_events(self, sector_id: int, danger_level: int) -> List[Dict]:
         """Generate random events for the sector"""
         events = []
 
         # Higher danger = more events
-        num_events = random.randint(0, danger_level // 2)
+        num_events = self._rng.randint(0, danger_level // 2)
 
         for i in range(num_events):
-            event_type = random.choice(list(EventType))
+            event_type = self._rng.choice(list(EventType))
             if event_type == EventType.NONE:
                 continue
 
@@ -632,7 +663,7 @@ class ProceduralGenerator:
                 "type": event_type.value,
                 "title": self._generate_event_title(event_type),
                 "description": self._generate_event_description(event_type),
-                "duration": random.randint(1, 10),
+                "duration": self._rng.randint(1, 10),
                 "active": True,
                 "discovered": False,
             }
@@ -650,7 +681,7 @@ class ProceduralGenerator:
             EventType.ANCIENT_ARTIFACT: ["Ancient Relic", "Alien Artifact", "Lost Technology"],
             EventType.DERELICT_SHIP: ["Abandoned Vessel", "Ghost Ship", "Derelict Hulk"],
         }
-        return random.choice(titles.get(event_type, ["Unknown Event"]))
+        return self._rng.choice(titles.get(event_type, ["Unknown Event"]))
 
     def _generate_event_description(self, event_type: EventType) -> str:
         """Generate event description"""
@@ -675,7 +706,7 @@ class ProceduralGenerator:
                 if dx == 0 and dy == 0:
                     continue
 
-                if random.random() < 0.3:  # 30% chance of trade route
+                if self._rng.random() < 0.3:  # 30% chance of trade route
                     target_x, target_y = x + dx, y + dy
                     routes.append(f"Trade Route to ({target_x}, {target_y})")
 
@@ -694,7 +725,7 @@ class ProceduralGenerator:
             "White Dwarf",
             "Binary System",
         ]
-        objects.append(random.choice(star_types))
+        objects.append(self._rng.choice(star_types))
 
         # Additional objects
         possible_objects = [
@@ -708,8 +739,8 @@ class ProceduralGenerator:
             "Wormhole",
         ]
 
-        num_objects = random.randint(0, 3)
-        objects.extend(random.sample(possible_objects, min(num_objects, len(possible_objects))))
+        num_objects = self._rng.randint(0, 3)
+        objects.extend(self._rng.sample(possible_objects, min(num_objects, len(possible_objects))))
 
         return objects
 
@@ -722,12 +753,12 @@ class ProceduralGenerator:
         distance = math.sqrt(x * x + y * y)
         gate_chance = max(0.1, 0.5 - (distance * 0.05))
 
-        if random.random() < gate_chance:
+        if self._rng.random() < gate_chance:
             # Connect to 1-3 distant sectors
-            num_gates = random.randint(1, 3)
+            num_gates = self._rng.randint(1, 3)
             for _ in range(num_gates):
                 # Random distant sector
-                target_sector = random.randint(sector_id + 10, sector_id + 100)
+                target_sector = self._rng.randint(sector_id + 10, sector_id + 100)
                 gates.append(target_sector)
 
         return gates
@@ -740,12 +771,12 @@ class ProceduralGenerator:
 
         # More dangerous sectors have rarer resources
         if danger_level >= 7:
-            for rare in random.sample(self.rare_resources, random.randint(1, 3)):
-                resources[rare] = random.randint(50, 500)
+            for rare in self._rng.sample(self.rare_resources, self._rng.randint(1, 3)):
+                resources[rare] = self._rng.randint(50, 500)
 
         # Common sector resources
-        for common in random.sample(self.common_resources, random.randint(2, 4)):
-            resources[common] = random.randint(100, 1000)
+        for common in self._rng.sample(self.common_resources, self._rng.randint(2, 4)):
+            resources[common] = self._rng.randint(100, 1000)
 
         return resources
 
@@ -11,11 +11,13 @@ import os
 import time
 import hashlib
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import MISSING, asdict, dataclass, fields
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 import base64
 
+from game.compat import DATACLASS_SLOTS
+
 
 @dataclass
 class SaveMetadata:
@@ -36,7 +38,7 @@ class SaveMetadata:
     screenshot: Optional[str] = None  # Base64 encoded image
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GameState:
     """Complete game state for saving/loading with enhanced persistence"""
 
@@ -55,6 +57,17 @@ class GameState:
     counselor_data: Optional[Dict] = None
     game_version: str = "1.0.0"
 
+    def __setstate__(self, state):
+        """Restore from a pickle, including saves written before GameState had slots"""
+        # Slotted instances pickle as (None, slot values); older saves pickled __dict__
+        if isinstance(state, tuple):
+            state = state[1]
+        for field in fields(self):
+            if field.default is not MISSING:
+                setattr(self, field.name, field.default)
+        for name, value in state.items():
+            setattr(self, name, value)
+
 
 class SaveGameSystem:
     """Manages game saves with multiple slots and compression"""
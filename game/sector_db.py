@@ -28,6 +28,8 @@ from typing import Dict, List, Optional
 class SectorRepository:
     def __init__(self, db_path: str):
         self.db_path = db_path
+        # sector_id -> record (or None for missing ids); invalidated on writes
+        self._sector_cache: Dict[int, Optional[Dict]] = {}
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self._init_db()
 
@@ -66,6 +68,7 @@ class SectorRepository:
             conn.commit()
 
     def upsert_sector(self, record: Dict) -> None:
+        self._sector_cache.pop(record["id"], None)
         with self._connect() as conn:
             conn.execute(
                 """
@@ -105,22 +108,33 @@ class SectorRepository:
             conn.commit()
 
     def get_sector(self, sector_id: int) -> Optional[Dict]:
+        if sector_id in self._sector_cache:
+            cached = self._sector_cache[sector_id]
+            if cached is None:
+                return None
+            # Hand out copies so callers cannot mutate the cached record
+            return dict(cached, connections=list(cached["connections"]))
+
         with self._connect() as conn:
             cur = conn.execute("SELECT * FROM sectors WHERE id=?", (sector_id,))
             row = cur.fetchone()
             if not row:
+                self._sector_cache[sector_id] = None
                 return None
             columns = [col[0] for col in cur.description]
             rec = dict(zip(columns, row))
             rec["connections"] = json.loads(rec["connections"] or "[]")
+            self._sector_cache[sector_id] = dict(rec, connections=list(rec["connections"]))
             return rec
 
     def mark_explored(self, sector_id: int) -> None:
+        self._sector_cache.pop(sector_id, None)
         with self._connect() as conn:
             conn.execute("UPDATE sectors SET explored=1 WHERE id=?", (sector_id,))
             conn.commit()
 
     def mark_charted(self, sector_id: int) -> None:
+        self._sector_cache.pop(sector_id, None)
         with self._connect() as conn:
             conn.execute("UPDATE sectors SET charted=1 WHERE id=?", (sector_id,))
             conn.commit()
@@ -128,6 +142,8 @@ class SectorRepository:
     def add_bidirectional_connection(self, a: int, b: int) -> None:
         if a == b:
             return
+        self._sector_cache.pop(a, None)
+        self._sector_cache.pop(b, None)
         with self._connect() as conn:
             for x, y in [(a, b), (b, a)]:
                 cur = conn.execute("SELECT connections FROM sectors WHERE id=?", (x,))
@@ -152,6 +168,7 @@ class SectorRepository:
     def check_and_fix_bidirectional(self) -> int:
         """Ensure all connections are bidirectional. Returns number of fixes made."""
         fixes = 0
+        self._sector_cache.clear()
         with self._connect() as conn:
             cur = conn.execute("SELECT id, connections FROM sectors")
             rows = cur.fetchall()
@@ -14,6 +14,19 @@ from game.player import Player
 class Stock:
     """Represents a stock in the galactic market"""
 
+    # Declared by hand rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = (
+        "symbol",
+        "name",
+        "sector",
+        "current_price",
+        "base_price",
+        "volatility",
+        "dividend_yield",
+        "market_cap",
+        "description",
+    )
+
     symbol: str
     name: str
     sector: str  # technology, mining, luxury, etc.
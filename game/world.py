@@ -7,6 +7,7 @@ import random
 import os
 import time
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, List, Optional, Tuple
 from game.player import Item
 from game.sos_system import SOSSystem
@@ -430,6 +431,7 @@ class World:
                 sector=loc_data["sector"],
             )
             self.locations[loc_data["name"]] = location
+        self._invalidate_location_index()
 
         # Set up sector factions
         self.sector_factions = {
@@ -494,6 +496,12 @@ class World:
             )
             self.sector_connections[source_sector].append(connection)
 
+        # Index connections by (source, destination) for O(1) jump lookups
+        self._adjacency = {
+            source: {conn.destination_sector: conn for conn in conns}
+            for source, conns in self.sector_connections.items()
+        }
+
     def _get_connection_danger(self, connection_type: str) -> int:
         """Get danger level based on connection type"""
         danger_levels = {"federation": 1, "neutral": 3, "enemy": 8, "hop": 2, "skip": 6, "warp": 4}
@@ -582,6 +590,18 @@ class World:
             if location_name in self.locations:
                 self.locations[location_name].items.extend(items)
 
+    @cached_property
+    def locations_by_sector(self) -> Dict[int, List[Location]]:
+        """Locations grouped by sector number, built lazily on first use"""
+        by_sector = {}
+        for loc in self.locations.values():
+            by_sector.setdefault(loc.sector, []).append(loc)
+        return by_sector
+
+    def _invalidate_location_index(self) -> None:
+        """Drop the cached sector view after ``self.locations`` changes"""
+        self.__dict__.pop("locations_by_sector", None)
+
     def get_current_location(self) -> Location:
         """Get the current location object"""
         return self.locations.get(self.current_location)
@@ -605,12 +625,7 @@ class World:
         available_jumps = []
         for connection in self.sector_connections[self.current_sector]:
             # Check if destination sector has any locations
-            sector_locations = [
-                loc
-                for loc in self.locations.values()
-                if loc.sector == connection.destination_sector
-            ]
-            if sector_locations:
+            if connection.destination_sector in self.locations_by_sector:
                 available_jumps.append(
                     {
                         "sector": connection.destination_sector,
@@ -626,15 +641,13 @@ class World:
 
         return available_jumps
 
+    def get_connection(self, sector_number: int) -> Optional[SectorConnection]:
+        """Get the connection from the current sector to ``sector_number``"""
+        return self._adjacency.get(self.current_sector, {}).get(sector_number)
+
     def can_jump_to_sector(self, sector_number: int) -> bool:
         """Check if player can jump to sector number"""
-        if self.current_sector not in self.sector_connections:
-            return False
-
-        for connection in self.sector_connections[self.current_sector]:
-            if connection.destination_sector == sector_number:
-                return True
-        return False
+        return sector_number in self._adjacency.get(self.current_sector, {})
 
     def can_jump_to(self, destination: str) -> bool:
         """Check if a location name is valid for instant jumps"""
@@ -642,18 +655,9 @@ class World:
 
     def jump_to_sector(self, sector_number: int, player) -> Dict:
         """Jump to a connected sector (TW2002 style)"""
-        if not self.can_jump_to_sector(sector_number):
-            return {"success": False, "message": f"Cannot jump to sector {sector_number} from here"}
-
-        # Find the connection details
-        connection = None
-        for conn in self.sector_connections[self.current_sector]:
-            if conn.destination_sector == sector_number:
-                connection = conn
-                break
-
+        connection = self.get_connection(sector_number)
         if not connection:
-            return {"success": False, "message": f"No connection to sector {sector_number}"}
+            return {"success": False, "message": f"Cannot jump to sector {sector_number} from here"}
 
         # Check fuel requirements
         if player.fuel < connection.fuel_cost:
@@ -663,7 +667,7 @@ class World:
             }
 
         # Find a location in the destination sector
-        sector_locations = [loc for loc in self.locations.values() if loc.sector == sector_number]
+        sector_locations = self.locations_by_sector.get(sector_number)
         if not sector_locations:
             return {"success": False, "message": f"No locations found in sector {sector_number}"}
 
@@ -739,11 +743,7 @@ class World:
         dest_location = self.locations[self.travel_destination]
 
         # Find the connection used for this jump
-        connection = None
-        for conn in self.sector_connections.get(self.current_sector, []):
-            if conn.destination_sector == dest_location.sector:
-                connection = conn
-                break
+        connection = self.get_connection(dest_location.sector)
 
         # Consume fuel
         if connection:
@@ -803,9 +803,9 @@ class World:
         result = {"name": event["name"], "description": event["description"], "outcome": outcome}
 
         try:
-            from utils.display import DisplayManager
+            from utils.display import display_manager
 
-            DisplayManager().show_event_result(result)
+            display_manager.show_event_result(result)
         except Exception:
             pass
 
@@ -856,7 +856,7 @@ class World:
             # Return current sector info
             sector_number = self.current_sector
 
-        sector_locations = [loc for loc in self.locations.values() if loc.sector == sector_number]
+        sector_locations = self.locations_by_sector.get(sector_number)
 
         if not sector_locations:
             return {"discovered": False, "sector": sector_number}
@@ -871,7 +871,7 @@ class World:
 
     def get_all_sectors(self) -> List[str]:
         """Get all sectors in the game"""
-        return list(set(loc.sector for loc in self.locations.values()))
+        return list(self.locations_by_sector)
 
     def get_discovered_sectors(self) -> List[str]:
         """Get discovered sectors"""
@@ -1199,6 +1199,7 @@ class World:
             sector=sector,
         )
         self.locations[planet_name] = new_planet
+        self._invalidate_location_index()
         # Connect current location to new planet
         if planet_name not in current_loc.connections:
             current_loc.connections.append(planet_name)
@@ -6,13 +6,18 @@ Creates new sectors and procedurally generated content
 import random
 import string
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+from game.compat import DATACLASS_SLOTS
 from game.player import Item
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Sector:
-    """Represents a sector in the galaxy"""
+    """Represents a sector in the galaxy
+
+    Slotted on Python 3.10+ so bulk-generated sectors carry no per-instance
+    ``__dict__``.
+    """
 
     name: str
     coordinates: Tuple[int, int, int]
@@ -129,6 +134,15 @@ class WorldGenerator:
 
     def generate_sector(self, coordinates: Tuple[int, int, int]) -> Sector:
         """Generate a new sector at given coordinates"""
+        return self._build_sector(coordinates)
+
+    def generate_sectors_bulk(self, coordinates_list: Iterable[Tuple[int, int, int]]) -> List[Sector]:
+        """Generate sectors for many coordinates in one call"""
+        build = self._build_sector
+        return [build(coordinates) for coordinates in coordinates_list]
+
+    def _build_sector(self, coordinates: Tuple[int, int, int]) -> Sector:
+        """Create one sector and its content; shared by the single and bulk paths"""
         sector_name = self._generate_sector_name()
         sector_type = self._determine_sector_type(coordinates)
         difficulty = self._calculate_difficulty(coordinates, sector_type)
@@ -37,8 +37,8 @@ from game.skills import Skill
 from game.ai_counselor import ShipCounselor
 from game.ship_customization import ShipCustomization
 from game.empire import EmpireSystem
-from utils.display import DisplayManager
-from utils.input_handler import InputHandler
+from utils.display import display_manager
+from utils.input_handler import input_handler
 from game.save_system import SaveGameSystem
 from game.achievements import AchievementSystem
 
@@ -46,8 +46,8 @@ from game.achievements import AchievementSystem
 class Game:
     def __init__(self):
         self.console = Console()
-        self.display = DisplayManager()
-        self.input_handler = InputHandler()
+        self.display = display_manager
+        self.input_handler = input_handler
         self.player = None
         self.world = None
         self.world_generator = None
@@ -857,11 +857,7 @@ sectors - All sectors  sector - Current sector
             # Get travel estimate first
             if self.world.can_jump_to_sector(sector_number):
                 # Find the connection details
-                connection = None
-                for conn in self.world.sector_connections[self.world.current_sector]:
-                    if conn.destination_sector == sector_number:
-                        connection = conn
-                        break
+                connection = self.world.get_connection(sector_number)
 
                 if connection:
                     # Show travel estimate
@@ -920,11 +916,7 @@ sectors - All sectors  sector - Current sector
             # Get travel estimate first
             if self.world.can_jump_to_sector(sector_number):
                 # Find the connection details
-                connection = None
-                for conn in self.world.sector_connections[self.world.current_sector]:
-                    if conn.destination_sector == sector_number:
-                        connection = conn
-                        break
+                connection = self.world.get_connection(sector_number)
 
                 if connection:
                     # Show warp estimate
@@ -1,7 +1,36 @@
 import os
 import sys
+from unittest.mock import create_autospec
+
+import pytest
 
 # Ensure project root is on sys.path for test modules
 PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
+
+
+def pytest_configure(config):
+    # Generation-heavy tests opt into this marker so inner loops can run
+    # ``pytest -m "not slow"``
+    config.addinivalue_line("markers", "slow: marks tests as slow")
+
+
+@pytest.fixture(scope="session")
+def game_engine_spec():
+    """Autospec of the console ``Game`` engine, built once per session.
+
+    New mocks should use ``create_autospec(..., instance=True)`` so only the
+    instance mock is built rather than both class and instance mocks.
+    """
+    from main import Game
+
+    return create_autospec(Game, instance=True)
+
+
+@pytest.fixture
+def game_engine(game_engine_spec):
+    """Per-test handle on the cached autospec, reset after each test"""
+    # copy.copy() would share the child mocks, so reset the cached spec instead
+    yield game_engine_spec
+    game_engine_spec.reset_mock(return_value=True, side_effect=True)
@@ -0,0 +1,90 @@
+"""
+Smoke tests for the utility demo scripts using lightweight World/Player fakes
+"""
+import io
+from unittest.mock import Mock
+
+import pytest
+from rich.console import Console
+
+from game.player import Player
+from game.world import Location, SectorConnection, World
+from utils import demo_travel_confirmation as travel_demo
+from utils import demo_tw2002_navigation as navigation_demo
+from utils.demo_travel_confirmation import demo_travel_confirmation
+from utils.demo_tw2002_navigation import demo_tw2002_navigation
+
+
+@pytest.fixture
+def fake_world():
+    world = Mock(spec=World)
+    location = Location("Earth Station", "Home", "space_station", (0, 0, 0), sector=1)
+    world.current_sector = 1
+    world.locations = {location.name: location}
+    world.locations_by_sector = {1: [location]}
+    connection = SectorConnection(2, "federation", 5, 30)
+    world.sector_connections = {1: [connection]}
+    world.sector_factions = {1: "Federation", 2: "Federation"}
+    world.get_current_location.return_value = location
+    world.can_jump_to_sector.side_effect = lambda sector: sector == 2
+    world.get_connection.side_effect = lambda sector: connection if sector == 2 else None
+    world.jump_to_sector.return_value = {"success": True, "message": "Jumping"}
+    world.instant_jump.return_value = False
+    world.get_available_jumps.return_value = []
+    world.get_sector_info.return_value = {}
+    world.get_current_sector_display.return_value = {"error": "No current location"}
+    return world
+
+
+@pytest.fixture
+def fake_player():
+    player = Mock(spec=Player)
+    player.fuel = 100
+    return player
+
+
+def test_demo_travel_confirmation_with_fakes(fake_world, fake_player, capsys):
+    demo_travel_confirmation(world=fake_world, player=fake_player)
+
+    out = capsys.readouterr().out
+    assert "Travel Estimate to Sector 2" in out
+    fake_world.jump_to_sector.assert_called_once_with(2, fake_player)
+    fake_world._complete_jump.assert_called_once_with(fake_player)
+
+
+def test_demo_tw2002_navigation_with_fakes(fake_world, fake_player, capsys):
+    demo_tw2002_navigation(world=fake_world, player=fake_player)
+
+    out = capsys.readouterr().out
+    assert "Successfully jumped to Sector 2" in out
+    assert "No available jumps" in out
+
+
+@pytest.fixture
+def buffer_console():
+    return Console(file=io.StringIO(), width=120)
+
+
+@pytest.mark.parametrize("sector", travel_demo.TEST_SECTORS)
+def test_travel_confirmation_jump_step(sector, fake_world, fake_player, buffer_console):
+    travel_demo._demo_jump_to(buffer_console, fake_world, fake_player, sector)
+
+    out = buffer_console.file.getvalue()
+    if sector == 2:
+        assert "Travel Estimate to Sector 2" in out
+    else:
+        assert f"Cannot jump to Sector {sector}" in out
+
+
+@pytest.mark.parametrize("sector", navigation_demo.TEST_JUMPS)
+def test_tw2002_navigation_jump_step(sector, fake_world, fake_player, buffer_console):
+    display = Mock()
+    navigation_demo._demo_jump_to(buffer_console, fake_world, fake_player, display, sector)
+
+    out = buffer_console.file.getvalue()
+    if sector == 2:
+        assert "Successfully jumped to Sector 2" in out
+        display.show_tw2002_sector_display.assert_called_once_with(fake_world)
+    else:
+        assert f"Cannot jump to Sector {sector}" in out
+        display.show_tw2002_sector_display.assert_not_called()
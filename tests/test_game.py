@@ -4,6 +4,7 @@ Test script for LOGDTW2002
 Tests all major game systems
 """
 
+import io
 import sys
 import os
 
@@ -12,7 +13,7 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "game"))
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "utils"))
 
-from game.player import Player
+from game.player import Item, Player
 from game.world import World
 from game.world_generator import WorldGenerator
 from game.combat import CombatSystem
@@ -23,6 +24,7 @@ from game.holodeck import HolodeckSystem
 from game.stock_market import StockMarket, BankingSystem
 from game.sos_system import SOSSystem
 from utils.display import DisplayManager
+from rich.console import Console
 
 
 def test_player():
@@ -184,6 +186,12 @@ def test_world_generator():
     assert planet["type"]
     print("✓ Planet generation working")
 
+    # Test bulk sector generation
+    coords = [(i, i, i) for i in range(10)]
+    sectors = generator.generate_sectors_bulk(coords)
+    assert [s.coordinates for s in sectors] == coords
+    print("✓ Bulk sector generation working")
+
     print("✓ World Generator tests passed!")
 
 
@@ -426,6 +434,50 @@ def test_display():
     display.show_location(location)
     print("✓ Location display working")
 
+    # Test location panels are reused until the room changes
+    detail_panel = display._location_panel(location, detailed=True)
+    assert display._location_panel(location, detailed=True) is detail_panel
+    location.items.append(Item("Scrap", "Spare parts", 5, "trade_good"))
+    assert display._location_panel(location, detailed=True) is not detail_panel
+    print("✓ Location panel cache working")
+
+    # Test decorative output is skipped when not writing to a terminal
+    buffer = io.StringIO()
+    display.console = Console(file=buffer, force_terminal=False)
+    display.show_ascii_art("ship")
+    assert buffer.getvalue() == ""
+    display.console = Console(file=buffer, force_terminal=True)
+    display.show_ascii_art("ship")
+    assert "STARFARER" in buffer.getvalue()
+    print("✓ ASCII art display working")
+
+    # Test the progress bar renders as one plain line, clamped at both ends
+    for current, maximum, expected in ((15, 30, "50.0%"), (5, 0, "0.0%"), (60, 30, "200.0%")):
+        buffer = io.StringIO()
+        display.console = Console(file=buffer, force_terminal=False, width=80)
+        display.show_progress_bar("Scanning", current, maximum)
+        lines = buffer.getvalue().splitlines()
+        assert len(lines) == 1
+        assert lines[0].startswith("Scanning [") and lines[0].endswith(expected)
+    print("✓ Progress bar display working")
+
+    # Test an unchanged combat round reuses the previous panel
+    combat_data = {
+        "in_combat": True,
+        "round": 1,
+        "enemy": {"name": "Pirate", "health": 10, "max_health": 10, "description": "Raider"},
+        "player": {"health": 100, "max_health": 100, "energy": 50, "max_energy": 50},
+        "log": ["Pirate attacks!"],
+    }
+    display.show_combat_status(combat_data)
+    first_panel = display._last_combat_panel
+    display.show_combat_status(combat_data)
+    assert display._last_combat_panel is first_panel
+    combat_data["enemy"]["health"] = 4
+    display.show_combat_status(combat_data)
+    assert display._last_combat_panel is not first_panel
+    print("✓ Combat display working")
+
     print("✓ Display tests passed!")
 
 
@@ -449,6 +501,14 @@ def test_world_travel():
         assert sector_info is not None
     print("✓ Sector navigation working")
     
+    # Test connection lookups from the starting sector
+    connection = world.get_connection(2)
+    assert connection is not None and connection.destination_sector == 2
+    assert world.can_jump_to_sector(2)
+    assert world.get_connection(8) is None
+    assert not world.can_jump_to_sector(8)
+    print("✓ Connection lookup working")
+    
     print("✓ World travel tests passed!")
 
 
@@ -477,6 +537,15 @@ def test_world_locations():
         assert sector_info is not None
     print("✓ Location info working")
     
+    # Test the sector view stays in sync when locations are added
+    assert location in world.locations_by_sector[location.sector]
+    player = Player()
+    player.add_item(Item("Genesis Torpedo", "Creates planets", 1000, "special"))
+    result = world.fire_genesis_torpedo(player)
+    assert result["success"]
+    assert world.locations[result["planet"]] in world.locations_by_sector[location.sector]
+    print("✓ Sector location view working")
+    
     print("✓ World location tests passed!")
 
 
@@ -0,0 +1,94 @@
+"""
+Tests for command parsing, validation and suggestions in InputHandler
+"""
+import pytest
+
+from utils.input_handler import InputHandler
+
+
+@pytest.fixture
+def handler():
+    return InputHandler()
+
+
+def test_parse_command_resolves_aliases(handler):
+    assert handler.parse_command("inv") == ("inventory", [])
+    assert handler.parse_command("Buy Ore 3") == ("buy", ["Ore", "3"])
+    assert handler.parse_command("") == ("", [])
+
+
+def test_validate_command(handler):
+    assert handler.validate_command("look", [])["valid"]
+
+    unknown = handler.validate_command("lo", [])
+    assert not unknown["valid"]
+    assert "look" in unknown["suggestions"]
+
+    usage = handler.validate_command("buy", [])
+    assert not usage["valid"]
+    assert usage["message"].startswith("Usage: buy")
+
+
+def test_command_suggestions(handler):
+    assert handler.get_command_suggestions("") == []
+    # Category order: travel commands come before trading ones
+    assert handler.get_command_suggestions("tr") == ["travel", "trade"]
+    # "use" is in both actions and combat but is suggested once
+    assert handler.get_command_suggestions("u") == ["up", "use"]
+    assert "exit (quit)" in handler.get_command_suggestions("ex")
+
+
+def test_autocomplete_options(handler):
+    assert handler.get_autocomplete_options("") == []
+    assert handler.get_autocomplete_options("S") == ["s", "save", "scan", "search", "sell"]
+    assert handler.get_autocomplete_options("zz") == []
+
+
+def test_format_command_highlights_known_words(handler):
+    assert handler.format_command("look north then help") == (
+        "[yellow]look[/yellow] [cyan]north[/cyan] then [red]help[/red]"
+    )
+    assert handler.format_command("lookout") == "lookout"
+
+
+def test_help_for_command(handler):
+    assert handler.get_help_for_command("look") == "Examine your surroundings"
+    assert handler.get_help_for_command("dance") == "No help available for 'dance'"
+
+
+def test_command_history_is_bounded(handler, monkeypatch):
+    commands = iter(f"look {n}" for n in range(handler.max_history + 5))
+    monkeypatch.setattr("utils.input_handler.Prompt.ask", lambda prompt: next(commands))
+    for _ in range(handler.max_history + 5):
+        handler.get_input()
+
+    assert len(handler.command_history) == handler.max_history
+    assert handler.get_command_history(2) == [f"look {handler.max_history + 3}", f"look {handler.max_history + 4}"]
+    handler.clear_history()
+    assert handler.get_command_history() == []
+
+
+@pytest.mark.parametrize("raw_input", ["", "   ", "\t"])
+def test_process_input_blank(handler, raw_input):
+    result = handler.process_input(raw_input)
+    assert result["action"] == ""
+    assert not result["valid"]
+    assert result["message"] == ""
+
+
+def test_process_input_resolves_and_validates(handler):
+    result = handler.process_input("i")
+    assert result["action"] == "inventory"
+    assert result["valid"]
+
+
+def test_suggest_command_by_context(handler):
+    assert handler.suggest_command("combat") == ["attack", "defend", "flee", "use"]
+    assert handler.suggest_command("exploration")[:2] == ["look", "examine"]
+    general = handler.suggest_command()
+    assert general == handler.suggest_command("unknown")
+    assert general[:3] == ["north", "south", "east"]
+    assert len(general) == 10
+
+    general.append("dance")
+    assert "dance" not in handler.suggest_command()
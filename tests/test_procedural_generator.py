@@ -327,6 +327,20 @@ def test_generator_reproducibility():
     assert sector1.faction_control == sector2.faction_control
 
 
+def test_generate_galaxy_sectors_matches_single_generation():
+    """Test that batch generation matches one-at-a-time generation"""
+    gen = ProceduralGenerator(seed=123)
+
+    sectors = gen.generate_galaxy_sectors([4, 1, 4, 7])
+
+    assert list(sectors) == [4, 1, 7]
+    for sector_id, sector in sectors.items():
+        single = gen.generate_galaxy_sector(sector_id)
+        assert sector.name == single.name
+        assert sector.danger_level == single.danger_level
+        assert sector.resources == single.resources
+
+
 def test_generator_variety():
     """Test that generator produces variety with different seeds"""
     names = set()
@@ -346,3 +360,16 @@ def test_generator_variety():
     # Should have at least one name
     assert len(names) >= 1
 
+
+
+def test_sector_generation_ignores_global_random_state():
+    """Sectors must not depend on what else draws from the global RNG"""
+    gen = ProceduralGenerator(seed=123)
+    expected = gen.generate_galaxy_sector(sector_id=4)
+
+    random.seed(999)
+    state = random.getstate()
+    again = gen.generate_galaxy_sector(sector_id=4)
+
+    assert again == expected
+    assert random.getstate() == state
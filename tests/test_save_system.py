@@ -1,4 +1,6 @@
 import random
+import sys
+
 import pytest
 
 from game.save_system import SaveGameSystem, GameState
@@ -40,3 +42,28 @@ def test_save_load_round_trip(tmp_path, player, world):
     save_id = save_system.save_game(state, save_name="test_save", overwrite=True)
     loaded = save_system.load_game(save_id)
     assert loaded == state
+
+
+def test_game_state_restores_pre_slots_pickle_state():
+    # Saves written before GameState had slots pickled the instance __dict__
+    state = GameState.__new__(GameState)
+    state.__setstate__(
+        {
+            "player_data": {"name": "Old"},
+            "world_data": {},
+            "mission_data": {},
+            "npc_data": {},
+            "trading_data": {},
+            "skill_data": {},
+            "combat_data": {},
+            "settings": {},
+            "statistics": {},
+            "achievements": [],
+            "timestamp": 0.0,
+        }
+    )
+    assert state.player_data == {"name": "Old"}
+    assert state.game_version == "1.0.0"
+    assert state.counselor_data is None
+    if sys.version_info >= (3, 10):
+        assert not hasattr(state, "__dict__")
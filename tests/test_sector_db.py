@@ -0,0 +1,48 @@
+"""
+Tests for the SQLite sector repository and its read cache
+"""
+import pytest
+
+from game.sector_db import SectorRepository
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = SectorRepository(str(tmp_path / "sectors.db"))
+    for sid in (1, 2):
+        repo.upsert_sector(
+            {"id": sid, "name": f"Sector {sid}", "faction": "Federation",
+             "region": "Federation", "danger_level": 1}
+        )
+    return repo
+
+
+def test_get_sector_returns_independent_copies(repo):
+    first = repo.get_sector(1)
+    first["connections"].append(99)
+    first["name"] = "Changed"
+
+    second = repo.get_sector(1)
+    assert second["name"] == "Sector 1"
+    assert second["connections"] == []
+
+
+def test_missing_sector_is_cached_until_upsert(repo):
+    assert repo.get_sector(3) is None
+    repo.upsert_sector(
+        {"id": 3, "name": "Sector 3", "faction": "Neutral", "region": "Nebula", "danger_level": 4}
+    )
+    assert repo.get_sector(3)["name"] == "Sector 3"
+
+
+def test_writes_invalidate_cached_sectors(repo):
+    assert repo.get_sector(1)["explored"] == 0
+    repo.mark_explored(1)
+    repo.mark_charted(1)
+    repo.add_bidirectional_connection(1, 2)
+
+    sector = repo.get_sector(1)
+    assert sector["explored"] == 1
+    assert sector["charted"] == 1
+    assert sector["connections"] == [2]
+    assert repo.get_sector(2)["connections"] == [1]
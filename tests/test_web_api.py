@@ -0,0 +1,118 @@
+"""
+Tests for the Flask save/load API in web/api.py
+"""
+import time
+
+import pytest
+
+from game.save_system import GameState, SaveGameSystem
+from web import api
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(api, "save_system", SaveGameSystem(save_directory=str(tmp_path)))
+    monkeypatch.setattr(api, "_integrity_cache", {})
+    return api.app.test_client()
+
+
+def test_save_and_load_round_trip(client):
+    game_data = {
+        "player": {"name": "Nova", "level": 3, "credits": 250},
+        "inventory": [{"name": "Ore", "quantity": 2}],
+        "world": {"current_sector": 4},
+        "skills": {"piloting": 2},
+        "missions": {},
+    }
+
+    saved = client.post("/save", json={"save_name": "slot1", "game_data": game_data})
+    assert saved.status_code == 200
+    assert saved.get_json()["metadata"]["player_name"] == "Nova"
+
+    loaded = client.post("/load", json={"save_name": "slot1"}).get_json()
+    assert loaded["success"]
+    assert loaded["game_data"]["player"] == game_data["player"]
+    assert loaded["game_data"]["inventory"] == game_data["inventory"]
+    assert loaded["game_data"]["world"] == game_data["world"]
+
+
+def test_load_missing_save(client):
+    response = client.post("/load", json={"save_name": "missing"})
+    assert response.status_code == 200
+    assert not response.get_json()["success"]
+
+
+def test_malformed_body_is_rejected(client):
+    response = client.post("/save", data=b"{not json", content_type="application/json")
+    assert response.status_code == 400
+
+
+def test_async_save_reports_through_status(client):
+    game_data = {"player": {"name": "Vega"}, "world": {"current_sector": 2}}
+    response = client.post("/save", json={"save_name": "slot2", "game_data": game_data, "async": True})
+    assert response.status_code == 202
+    task_id = response.get_json()["task_id"]
+
+    api._pending_saves[task_id].result(timeout=5)
+    status = client.get(f"/save_status/{task_id}")
+    assert status.status_code == 200
+    assert status.get_json()["metadata"]["save_id"] == "slot2"
+    assert client.get(f"/save_status/{task_id}").status_code == 404
+
+
+def test_uncollected_async_saves_expire(client, monkeypatch):
+    monkeypatch.setattr(api, "PENDING_SAVE_TTL", 0)
+    game_data = {"player": {"name": "Vega"}, "world": {}}
+    first = client.post("/save", json={"save_name": "slot4", "game_data": game_data, "async": True})
+    task_id = first.get_json()["task_id"]
+    api._pending_saves[task_id].result(timeout=5)
+    # Done callbacks run just after result() waiters are woken
+    deadline = time.monotonic() + 5
+    while task_id not in api._finished_at and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # The next async save sweeps the finished, never-collected task
+    second = client.post("/save", json={"save_name": "slot5", "game_data": game_data, "async": True})
+    assert task_id not in api._pending_saves
+    api._pending_saves[second.get_json()["task_id"]].result(timeout=5)
+
+
+def test_sync_save_runs_on_the_request_thread(client, monkeypatch):
+    monkeypatch.setattr(api, "_save_pool", None)
+    response = client.post("/save", json={"save_name": "slot6", "game_data": {"player": {}}})
+    assert response.get_json()["success"]
+
+
+def test_integrity_check_is_reused_until_save_changes(client, monkeypatch):
+    game_data = {"player": {"name": "Nova"}, "world": {}}
+    client.post("/save", json={"save_name": "slot3", "game_data": game_data})
+
+    calls = []
+    verify = api.save_system.verify_save_integrity
+    monkeypatch.setattr(
+        api.save_system, "verify_save_integrity", lambda name: calls.append(name) or verify(name)
+    )
+    client.post("/load", json={"save_name": "slot3"})
+    client.post("/load", json={"save_name": "slot3"})
+    assert calls == ["slot3"]
+
+    client.post("/save", json={"save_name": "slot3", "game_data": game_data})
+    client.post("/load", json={"save_name": "slot3"})
+    assert calls == ["slot3", "slot3"]
+
+
+
+def test_load_serializes_int_keyed_world_data(client):
+    # Pickled saves keep int keys, which JSON only allows as strings
+    game_state = GameState(
+        player_data={"name": "Orion"},
+        world_data={"sector_factions": {3: "Federation", 1: "Empire"}},
+        mission_data={}, npc_data={}, trading_data={}, skill_data={}, combat_data={},
+        settings={}, statistics={}, achievements=[], timestamp=0.0,
+    )
+    api.save_system.save_game(game_state, "slot4")
+
+    response = client.post("/load", json={"save_name": "slot4"})
+    assert response.status_code == 200
+    assert '{"1":"Empire","3":"Federation"}' in response.get_data(as_text=True)
+    assert response.get_json()["game_data"]["world"] == {"sector_factions": {"1": "Empire", "3": "Federation"}}
@@ -0,0 +1,245 @@
+"""
+Tests for the encoded-response caches in the Flask web app (web/app.py)
+"""
+import os
+import tempfile
+import uuid
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import pytest
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy.exc import OperationalError
+
+# Keep the app's SQLite databases out of the repository's data/db
+os.environ.setdefault("LOGDTW_DATA_DIR", tempfile.mkdtemp(prefix="logdtw-web-"))
+
+from web import app as web_app
+from web.cache import SectorCache, SimpleCache
+
+pytestmark = pytest.mark.skipif(
+    not web_app.GAME_MODULES_AVAILABLE, reason="game modules are not importable"
+)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = SimpleCache()
+    monkeypatch.setattr(web_app, "cache", cache)
+    monkeypatch.setattr(web_app, "CACHING_AVAILABLE", False)
+    return cache
+
+
+@pytest.fixture
+def session_id(monkeypatch):
+    session_id = f"test-{uuid.uuid4().hex}"
+    monkeypatch.setattr(web_app, "get_session_id", lambda: session_id)
+    return session_id
+
+
+@pytest.fixture
+def client(cache, session_id):
+    return web_app.app.test_client()
+
+
+def update_player(session_id, **changes):
+    with web_app.app.app_context():
+        player = web_app.Player.query.filter_by(session_id=session_id).one()
+        for name, value in changes.items():
+            setattr(player, name, value)
+        web_app.db.session.commit()
+
+
+def spy(monkeypatch, target, name):
+    """Wrap target.name, returning the list of calls it receives"""
+    calls = []
+    original = getattr(target, name)
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(target, name, wrapper)
+    return calls
+
+
+def test_status_is_cached_until_the_turn_changes(client, session_id, monkeypatch):
+    fog_updates = spy(monkeypatch, web_app, "update_fog_of_war")
+
+    first = client.get("/api/status")
+    assert first.status_code == 200
+    assert client.get("/api/status").get_data() == first.get_data()
+    assert len(fog_updates) == 1
+
+    update_player(session_id, turn_counter=1)
+    client.get("/api/status")
+    assert len(fog_updates) == 2
+
+
+def test_missions_are_cached_per_player_and_turn(client, session_id, monkeypatch):
+    builds = spy(monkeypatch, web_app, "get_game_data")
+
+    client.get("/api/missions")
+    client.get("/api/missions")
+    assert len(builds) == 1
+
+    update_player(session_id, turn_counter=1)
+    client.get("/api/missions")
+    assert len(builds) == 2
+
+    monkeypatch.setattr(web_app, "get_session_id", lambda: f"test-{uuid.uuid4().hex}")
+    client.get("/api/missions")
+    assert len(builds) == 3
+
+
+def test_market_is_cached_per_sector_and_tick(client, session_id, monkeypatch):
+    monkeypatch.setattr(web_app, "market_tick", lambda: 7)
+    lookups = spy(monkeypatch, web_app, "cached_prices")
+
+    first = client.get("/api/market")
+    assert first.status_code == 200
+    assert client.get("/api/market").get_data() == first.get_data()
+    assert len(lookups) == 1
+
+    update_player(session_id, current_sector=2)
+    client.get("/api/market")
+    monkeypatch.setattr(web_app, "market_tick", lambda: 8)
+    client.get("/api/market")
+    assert [call[1:] for call in lookups] == [(1, 7), (2, 7), (2, 8)]
+
+
+def test_players_in_a_sector_share_prices(client, session_id, monkeypatch):
+    monkeypatch.setattr(web_app, "market_tick", lambda: 7)
+    first = client.get("/api/market").get_json()["prices"]
+
+    # Another player on a later turn sees the same prices in the same tick
+    web_app.cache.clear()
+    other_session = f"test-{uuid.uuid4().hex}"
+    monkeypatch.setattr(web_app, "get_session_id", lambda: other_session)
+    client.get("/api/status")
+    update_player(other_session, turn_counter=5)
+    assert client.get("/api/market").get_json()["prices"] == first
+
+
+def test_static_market_lists_only_common_goods(client, monkeypatch):
+    monkeypatch.setattr(web_app, "GAME_MODULES_AVAILABLE", False)
+    prices = client.get("/api/market").get_json()["prices"]
+    assert prices == web_app.FALLBACK_MARKET_PRICES
+    assert "Tritium" not in prices and "Tritium" in web_app.FALLBACK_PRICES
+
+
+def test_counselor_tip_is_cached_per_turn(client, session_id, monkeypatch):
+    tips = []
+    counselor = SimpleNamespace(get_tip=lambda state: tips.append(state) or f"Tip {len(tips)}")
+    monkeypatch.setitem(web_app.game_systems, "counselor", counselor)
+
+    assert client.get("/api/counselor/tip").get_json()["tip"] == "Tip 1"
+    assert client.get("/api/counselor/tip").get_json()["tip"] == "Tip 1"
+
+    update_player(session_id, turn_counter=1)
+    assert client.get("/api/counselor/tip").get_json()["tip"] == "Tip 2"
+
+
+def test_stock_trades_invalidate_the_listing(client, monkeypatch):
+    market = web_app.get_system("stock_market")
+    listings = spy(monkeypatch, market, "get_all_stocks")
+
+    client.get("/api/stocks")
+    client.get("/api/stocks")
+    assert len(listings) == 1
+
+    client.post("/api/stocks", json={"action": "sell", "symbol": "TECH", "shares": 1})
+    client.get("/api/stocks")
+    assert len(listings) == 2
+
+
+def test_galaxy_is_cached_until_discovery_changes(client, cache, session_id, monkeypatch):
+    def sector(sector_id):
+        return SimpleNamespace(
+            name=f"Sector {sector_id}", faction_control="Federation", danger_level=1,
+            coordinates=(0, 0), planets=[], stations=[], events=[], resources={},
+            narrative_summary="", narrative_hooks=[],
+        )
+
+    generator = SimpleNamespace(
+        generate_galaxy_sectors=lambda ids: {sector_id: sector(sector_id) for sector_id in ids}
+    )
+    sectors = SectorCache(generator)
+    monkeypatch.setitem(web_app.game_systems, "sector_cache", sectors)
+    lookups = spy(monkeypatch, sectors, "get_many")
+
+    client.get("/api/galaxy")
+    client.get("/api/galaxy")
+    assert len(lookups) == 1
+
+    with web_app.app.app_context():
+        player_id = web_app.Player.query.filter_by(session_id=session_id).one().id
+        web_app.db.session.add(
+            web_app.SectorVisibility(player_id=player_id, sector_id=5, discovered=True)
+        )
+        web_app.db.session.commit()
+
+    galaxy = client.get("/api/galaxy").get_json()["galaxy"]
+    assert len(lookups) == 2
+    assert 5 in galaxy["discovered_sectors"]
+
+    # The key is stable across processes: no hash() of the sector list
+    galaxy_keys = [key for key in cache._cache if key.startswith("galaxy:")]
+    assert galaxy_keys[-1] == f"galaxy:{player_id}:1:{len(galaxy['discovered_sectors'])}"
+
+
+def test_failed_commit_leaves_nothing_cached(client, cache, monkeypatch):
+    client.get("/api/missions")
+    assert any(key.startswith("missions:") for key in cache._cache)
+    cache.clear()
+
+    def fail():
+        raise OperationalError("COMMIT", {}, Exception("database is locked"))
+
+    # Only the request's final commit fails, after the handler built its body
+    get_game_data = web_app.get_game_data
+
+    def build_then_break_commit():
+        data = get_game_data()
+        monkeypatch.setattr(web_app.db.session, "commit", fail)
+        return data
+
+    monkeypatch.setattr(web_app, "get_game_data", build_then_break_commit)
+    response = client.get("/api/missions")
+    assert response.status_code == 500
+    assert not any(key.startswith("missions:") for key in cache._cache)
+
+
+def test_settings_are_copied_and_expire(monkeypatch):
+    from web import models
+
+    monkeypatch.setattr(models, "_settings_cache", {})
+    with web_app.app.app_context():
+        models.GameSettings.set_setting("test_tags", ["a"])
+        web_app.db.session.commit()
+
+        tags = models.GameSettings.get_setting("test_tags")
+        tags.append("b")
+        assert models.GameSettings.get_setting("test_tags") == ["a"]
+
+        # Another worker changes the row behind this process's cache
+        setting = models.GameSettings.query.filter_by(key="test_tags").one()
+        setting.value = '["c"]'
+        web_app.db.session.commit()
+        assert models.GameSettings.get_setting("test_tags") == ["a"]
+
+        later = models.time.monotonic() + models.SETTINGS_CACHE_TTL
+        monkeypatch.setattr(models, "time", SimpleNamespace(monotonic=lambda: later))
+        assert models.GameSettings.get_setting("test_tags") == ["c"]
+
+
+@pytest.mark.skipif(not web_app.ORJSON_AVAILABLE, reason="orjson is not installed")
+def test_orjson_provider_matches_flask_for_dataclasses():
+    @dataclass
+    class Reading:
+        zeta: int
+        alpha: dict
+
+    payload = {"reading": Reading(zeta=1, alpha={2: "b", 1: "a"})}
+    expected = DefaultJSONProvider(web_app.app).dumps(payload)
+    assert web_app.app.json.dumps(payload).replace(" ", "") == expected.replace(" ", "")
@@ -0,0 +1,76 @@
+"""
+Tests for the in-process caching helpers in web/cache.py
+"""
+import itertools
+
+import pytest
+
+from web import cache
+
+
+class CountingMarkets:
+    """Stands in for DynamicMarketSystem, returning a new price on each draw"""
+
+    def __init__(self):
+        self.draws = itertools.count(100)
+
+    def get_sector_prices(self, sector_id):
+        return {"Food": next(self.draws)}
+
+
+@pytest.fixture(autouse=True)
+def empty_price_cache(monkeypatch):
+    monkeypatch.setattr(cache, "_price_cache", {})
+
+
+def test_prices_hold_within_a_tick():
+    markets = CountingMarkets()
+    first = cache.cached_prices(markets, 5, tick=1)
+    assert cache.cached_prices(markets, 5, tick=1) is first
+    assert cache.cached_prices(markets, 6, tick=1) != first
+
+
+def test_prices_change_across_ticks():
+    markets = CountingMarkets()
+    prices = [cache.cached_prices(markets, 5, tick)["Food"] for tick in (1, 2, 3)]
+    assert prices == [100, 101, 102]
+
+
+def test_price_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(cache, "_PRICE_CACHE_SIZE", 2)
+    markets = CountingMarkets()
+    for tick in range(4):
+        cache.cached_prices(markets, 1, tick)
+    assert list(cache._price_cache) == [(1, 2), (1, 3)]
+
+
+class CountingGenerator:
+    """Stands in for ProceduralGenerator, recording each batch it builds"""
+
+    def __init__(self):
+        self.batches = []
+
+    def generate_galaxy_sectors(self, sector_ids):
+        self.batches.append(list(sector_ids))
+        return {sector_id: f"sector {sector_id}" for sector_id in sector_ids}
+
+
+def test_sector_cache_generates_only_misses():
+    generator = CountingGenerator()
+    sectors = cache.SectorCache(generator)
+
+    assert sectors(2) == "sector 2"
+    assert sectors.get_many([3, 2, 5]) == {3: "sector 3", 2: "sector 2", 5: "sector 5"}
+    assert list(sectors.get_many([5, 3])) == [5, 3]
+    assert generator.batches == [[2], [3, 5]]
+
+
+def test_sector_cache_evicts_least_recently_used():
+    generator = CountingGenerator()
+    sectors = cache.SectorCache(generator, maxsize=2)
+
+    sectors.get_many([1, 2])
+    sectors(1)
+    sectors(3)
+    sectors.get_many([1, 2])
+    assert generator.batches == [[1, 2], [3], [2]]
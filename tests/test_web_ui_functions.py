@@ -2,13 +2,59 @@
 Tests for web UI button functions and error handling
 """
 import pytest
-import json
-from unittest.mock import Mock, patch, MagicMock
-import sys
-import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Placeholder for browser-only scenarios; pytest skips setup/teardown for these
+_PLACEHOLDER = pytest.mark.skip(reason="placeholder - implement against Selenium/Playwright")
+
+# Button functions referenced from the HTML templates
+REQUIRED_FUNCTIONS = [
+    'executeCommand',
+    'saveGame',
+    'loadGame',
+    'showHelp',
+    'showTravelMenu',
+    'travelToSector',
+    'scanSector',
+    'showMarket',
+    'showTradingPost',
+    'buyFromModal',
+    'sellFromModal',
+    'scanForEnemies',
+    'showWeapons',
+    'emergencyJump',
+    'showMissions',
+    'showActiveMissions',
+    'contactNPCs',
+    'showAchievements',
+    'refuel',
+    'repair',
+    'restockSupplies',
+    'checkMail',
+    'showGalaxyMap',
+    'randomJump',
+    'showMarketAnalysis',
+    'showTradeRoutes',
+    'showCombatLog',
+    'showStats',
+    'showLoginModal',
+    'showRegisterModal',
+    'logoutUser',
+    'continueGame'
+]
+
+# Sector values travelToSector must reject
+INVALID_SECTORS = [-1, 0, 1001, None, 'invalid', '']
+
+
+def _is_invalid_input(user_input):
+    """Mirror the client-side checks for login fields and trade quantities"""
+    for field in ('username', 'password'):
+        if field in user_input and not user_input[field]:
+            return True
+    if 'quantity' in user_input:
+        quantity = user_input['quantity']
+        return not isinstance(quantity, int) or quantity <= 0
+    return False
 
 
 class TestWebUIFunctions:
@@ -18,48 +64,15 @@ class TestWebUIFunctions:
         """Verify all required button functions are defined"""
         # This test verifies that all button functions mentioned in HTML exist
         # In a real browser environment, these would be tested with Selenium/Playwright
-        required_functions = [
-            'executeCommand',
-            'saveGame',
-            'loadGame',
-            'showHelp',
-            'showTravelMenu',
-            'travelToSector',
-            'scanSector',
-            'showMarket',
-            'showTradingPost',
-            'buyFromModal',
-            'sellFromModal',
-            'scanForEnemies',
-            'showWeapons',
-            'emergencyJump',
-            'showMissions',
-            'showActiveMissions',
-            'contactNPCs',
-            'showAchievements',
-            'refuel',
-            'repair',
-            'restockSupplies',
-            'checkMail',
-            'showGalaxyMap',
-            'randomJump',
-            'showMarketAnalysis',
-            'showTradeRoutes',
-            'showCombatLog',
-            'showStats',
-            'showLoginModal',
-            'showRegisterModal',
-            'logoutUser',
-            'continueGame'
-        ]
         
         # In a real test environment, we would check if these functions exist
         # For now, we just verify the list is complete
-        assert len(required_functions) > 0
-        assert 'executeCommand' in required_functions
-        assert 'saveGame' in required_functions
-        assert 'loadGame' in required_functions
+        assert len(REQUIRED_FUNCTIONS) > 0
+        assert 'executeCommand' in REQUIRED_FUNCTIONS
+        assert 'saveGame' in REQUIRED_FUNCTIONS
+        assert 'loadGame' in REQUIRED_FUNCTIONS
     
+    @_PLACEHOLDER
     def test_error_handling_game_not_initialized(self):
         """Test error handling when game engine is not initialized"""
         # This would be tested in a browser environment
@@ -73,12 +86,12 @@ class TestWebUIFunctions:
         # - Sector > 1000
         # - Sector is NaN
         # - Sector is None
-        invalid_sectors = [-1, 0, 1001, None, 'invalid', '']
         
-        for sector in invalid_sectors:
+        for sector in INVALID_SECTORS:
             # In a real test, we would call travelToSector and verify error handling
             assert sector is not None or isinstance(sector, (int, str))
     
+    @_PLACEHOLDER
     def test_error_handling_missing_dom_elements(self):
         """Test error handling when DOM elements are missing"""
         # Test cases for functions that depend on DOM elements:
@@ -105,35 +118,31 @@ class TestWebUIFunctions:
             assert 'status' in error
             assert 'message' in error
     
-    def test_error_handling_invalid_input(self):
+    @pytest.mark.parametrize(
+        "user_input, expected_invalid",
+        [
+            # Empty username/password in login
+            ({'username': '', 'password': 'test'}, True),
+            ({'username': 'test', 'password': ''}, True),
+            ({'username': '', 'password': ''}, True),
+            # Invalid quantity in buy/sell
+            ({'quantity': -1}, True),
+            ({'quantity': 0}, True),
+            ({'quantity': 'invalid'}, True),
+            # Valid inputs must pass validation
+            ({'username': 'test', 'password': 'test'}, False),
+            ({'quantity': 5}, False),
+        ],
+    )
+    def test_error_handling_invalid_input(self, user_input, expected_invalid):
         """Test error handling for invalid user input"""
-        # Test cases:
-        # - Empty username/password in login
-        # - Invalid quantity in buy/sell
-        # - Missing required fields
-        invalid_inputs = [
-            {'username': '', 'password': 'test'},
-            {'username': 'test', 'password': ''},
-            {'username': '', 'password': ''},
-            {'quantity': -1},
-            {'quantity': 0},
-            {'quantity': 'invalid'},
-        ]
-        
-        for invalid_input in invalid_inputs:
-            # Verify that validation would catch these
-            has_empty = any(not v for v in invalid_input.values() if isinstance(v, str))
-            has_invalid_number = any(
-                isinstance(v, (int, str)) and 
-                (isinstance(v, str) and not v.isdigit() or isinstance(v, int) and v <= 0)
-                for v in invalid_input.values()
-            )
-            assert has_empty or has_invalid_number or True  # At least one validation would fail
+        assert _is_invalid_input(user_input) is expected_invalid
 
 
 class TestGameEngineErrorHandling:
     """Test GameEngine error handling"""
     
+    @_PLACEHOLDER
     def test_send_request_error_handling(self):
         """Test sendRequest error handling"""
         # Test cases:
@@ -143,6 +152,7 @@ class TestGameEngineErrorHandling:
         # - Missing API_BASE
         pass
     
+    @_PLACEHOLDER
     def test_load_game_state_error_handling(self):
         """Test loadGameState error handling"""
         # Test cases:
@@ -170,6 +180,7 @@ class TestGameEngineErrorHandling:
             # Verify that error handling would catch these
             assert cmd is None or not isinstance(cmd, str) or not cmd.strip()
     
+    @_PLACEHOLDER
     def test_execute_command_error_handling(self):
         """Test executeCommand error handling"""
         # Test cases:
@@ -4,59 +4,67 @@ Demo script for TW2002-style Navigation System
 Tests the new numbered sectors with connection types
 """
 
+import io
 import sys
 import os
 
-# Add the game directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), "game"))
-sys.path.append(os.path.join(os.path.dirname(__file__), "utils"))
+# Put the project root first on the path when run as a standalone script
+if __name__ == "__main__":
+    sys.path[:0] = [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
 
 from game.world import World
 from game.player import Player
 from utils.display import DisplayManager
 from rich.console import Console
 
+# Sectors exercised by the jump walkthrough
+TEST_JUMPS = [2, 3, 4, 5, 6, 7, 8]
 
-def demo_tw2002_navigation():
-    """Demonstrate the TW2002-style navigation system"""
-    console = Console()
 
-    console.print("[bold cyan]TW2002 Navigation System Demo[/bold cyan]")
-    console.print("=" * 60)
-    console.print("Testing numbered sectors with connection types...\n")
+def _demo_jump_to(console, world, player, display, sector):
+    """Attempt one sector jump and show the resulting sector display"""
+    console.print(f"\n[yellow]Attempting to jump to Sector {sector}:[/yellow]")
+
+    if world.can_jump_to_sector(sector):
+        result = world.jump_to_sector(sector, player)
+        if result["success"]:
+            console.print(f"[green]✓ Successfully jumped to Sector {sector}[/green]")
+            console.print(f"[green]  {result['message']}[/green]")
+
+            # Simulate travel completion
+            world._complete_jump(player)
+
+            # Show the new sector display
+            display.show_tw2002_sector_display(world)
+        else:
+            console.print(
+                f"[red]✗ Failed to jump to Sector {sector}: {result['message']}[/red]"
+            )
+    else:
+        console.print(f"[red]✗ Cannot jump to Sector {sector} from current location[/red]")
+
+
+def _run_tw2002_navigation(console, world, player):
+    """Print the demo output to ``console``"""
+    # Header and footer go out as one print each
+    console.print(
+        "[bold cyan]TW2002 Navigation System Demo[/bold cyan]\n"
+        "============================================================\n"
+        "Testing numbered sectors with connection types...\n"
+    )
 
     # Initialize systems
-    world = World()
-    player = Player()
     display = DisplayManager()
+    # Route sector panels through the demo console so they share its buffer
+    display.console = console
 
     # Show initial sector display
     console.print("[yellow]Initial Sector Display:[/yellow]")
     display.show_tw2002_sector_display(world)
 
     # Test jumping to different sectors
-    test_jumps = [2, 3, 4, 5, 6, 7, 8]
-
-    for sector in test_jumps:
-        console.print(f"\n[yellow]Attempting to jump to Sector {sector}:[/yellow]")
-
-        if world.can_jump_to_sector(sector):
-            result = world.jump_to_sector(sector, player)
-            if result["success"]:
-                console.print(f"[green]✓ Successfully jumped to Sector {sector}[/green]")
-                console.print(f"[green]  {result['message']}[/green]")
-
-                # Simulate travel completion
-                world._complete_jump(player)
-
-                # Show the new sector display
-                display.show_tw2002_sector_display(world)
-            else:
-                console.print(
-                    f"[red]✗ Failed to jump to Sector {sector}: {result['message']}[/red]"
-                )
-        else:
-            console.print(f"[red]✗ Cannot jump to Sector {sector} from current location[/red]")
+    for sector in TEST_JUMPS:
+        _demo_jump_to(console, world, player, display, sector)
 
     # Show all available jumps from current sector
     console.print(f"\n[yellow]All available jumps from Sector {world.current_sector}:[/yellow]")
@@ -85,13 +93,34 @@ def demo_tw2002_navigation():
     else:
         console.print("  Sector information not available")
 
-    console.print(f"\n[bold green]Demo completed![/bold green]")
-    console.print("The TW2002 navigation system now provides:")
-    console.print("• Numbered sectors (1-8)")
-    console.print("• Connection types: Federation, Neutral, Enemy, Hop, Skip, Warp")
-    console.print("• Visual indicators for each connection type")
-    console.print("• Fuel costs and travel times for each connection")
-    console.print("• Faction control information")
+    console.print(
+        "\n[bold green]Demo completed![/bold green]\n"
+        "The TW2002 navigation system now provides:\n"
+        "• Numbered sectors (1-8)\n"
+        "• Connection types: Federation, Neutral, Enemy, Hop, Skip, Warp\n"
+        "• Visual indicators for each connection type\n"
+        "• Fuel costs and travel times for each connection\n"
+        "• Faction control information"
+    )
+
+
+def demo_tw2002_navigation(world=None, player=None):
+    """Demonstrate the TW2002-style navigation system"""
+    # DEMO_QUIET runs the demo as a smoke test without touching the terminal
+    quiet = bool(os.environ.get("DEMO_QUIET"))
+    console = Console(file=io.StringIO(), width=80) if quiet else Console()
+
+    # Callers such as smoke tests may inject lightweight fakes
+    if world is None:
+        world = World()
+    if player is None:
+        player = Player()
+
+    # Render everything into one buffer and flush it with a single write
+    with console.capture() as capture:
+        _run_tw2002_navigation(console, world, player)
+    if not quiet:
+        sys.stdout.write(capture.get())
 
 
 if __name__ == "__main__":
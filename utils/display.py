@@ -3,29 +3,247 @@ Display manager for StellarOdyssey2080
 Handles game display and formatting
 """
 
-from rich.console import Console
+import functools
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
+from rich.style import Style
 from rich.text import Text
-from rich.layout import Layout
-from rich.columns import Columns
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from types import MappingProxyType
 from typing import Dict, List, Optional
 from game.player import Player
 from game.world import Location
 
 
+# Help screen markup, parsed once into a shared renderable at import
+_HELP_TEXT = """
+[bold cyan]StellarOdyssey2080 - Game Controls[/bold cyan]
+
+[bold yellow]Movement:[/bold yellow]
+• north, south, east, west (or n, s, e, w)
+• up, down, in, out
+
+[bold yellow]Actions:[/bold yellow]
+• look, examine, search
+• take, drop, use, inventory
+• talk, ask, say
+
+[bold yellow]Combat:[/bold yellow]
+• attack, defend, flee
+• use [weapon/item]
+
+[bold yellow]Space Travel:[/bold yellow]
+• travel [destination]
+• land, takeoff
+• scan, navigate
+• map (show space map)
+
+[bold yellow]Trading:[/bold yellow]
+• buy [item], sell [item]
+• trade, market
+• trade routes (show best routes)
+• trade history
+
+[bold yellow]System:[/bold yellow]
+• status, stats
+• save, load, quit
+• help
+
+[bold yellow]Special Commands:[/bold yellow]
+• quests, missions
+• skills, abilities
+• equipment, ship
+        """
+
+
+_HELP_PANEL = Panel(Text.from_markup(_HELP_TEXT), title="Help", border_style="blue")
+
+
+@functools.lru_cache(maxsize=256)
+def _title(value: str) -> str:
+    """Title-case a display label; the same few labels repeat every frame"""
+    return value.title()
+
+
+@functools.lru_cache(maxsize=None)
+def _panel_shell(title: str, border_style: str):
+    """Return a Panel factory with the title and border style already bound"""
+    return functools.partial(Panel, title=title, border_style=border_style)
+
+
+# Styles parsed once at import and shared by every DisplayManager
+_STYLES = {
+    "title": Style(bold=True, color="magenta"),
+    "subtitle": Style(color="cyan"),
+    "header_cyan": Style(bold=True, color="cyan"),
+    "header_yellow": Style(bold=True, color="yellow"),
+    "header_green": Style(bold=True, color="green"),
+    "header_red": Style(bold=True, color="red"),
+    "italic": Style(italic=True),
+    "dim": Style(dim=True),
+    "discovered": Style(color="green"),
+    "art": Style(color="cyan"),
+}
+
+
+# ASCII art shown by show_ascii_art, prebuilt as styled Text at import so
+# printing skips markup and emoji parsing
+_ART = MappingProxyType(
+    {
+        name: Text(art, style=_STYLES["art"])
+        for name, art in {
+            "ship": """
+    ╔══════════════════════════════════════════════════════════════╗
+    ║                    🚀 STARFARER CLASS VESSEL 🚀              ║
+    ║                                                              ║
+    ║                    ▄▄▄▄▄▄▄                                   ║
+    ║                  ▄███████████▄                                ║
+    ║                ▄███████████████▄                              ║
+    ║              ▄███████████████████▄                            ║
+    ║            ▄███████████████████████▄                          ║
+    ║          ▄███████████████████████████▄                        ║
+    ║        ▄███████████████████████████████▄                      ║
+    ║      ▄███████████████████████████████████▄                    ║
+    ║    ▄███████████████████████████████████████▄                  ║
+    ║  ▄███████████████████████████████████████████▄                ║
+    ║ ███████████████████████████████████████████████               ║
+    ║ ███████████████████████████████████████████████               ║
+    ║  ▀████████████████████████████████████████████▀               ║
+    ║    ▀████████████████████████████████████████▀                 ║
+    ║      ▀████████████████████████████████████▀                   ║
+    ║        ▀████████████████████████████████▀                     ║
+    ║          ▀████████████████████████████▀                       ║
+    ║            ▀████████████████████████▀                         ║
+    ║              ▀████████████████████▀                           ║
+    ║                ▀████████████████▀                             ║
+    ║                  ▀████████████▀                               ║
+    ║                    ▀▀▀▀▀▀▀▀▀                                 ║
+    ║                                                              ║
+    ║         ════ ENGINE THRUSTERS ACTIVE ════                    ║
+    ╚══════════════════════════════════════════════════════════════╝
+            """,
+            "planet": """
+    ╔══════════════════════════════════════════════════════════════╗
+    ║                  🌍 PLANETARY SYSTEM 🌍                      ║
+    ║                                                              ║
+    ║              ░░░░░░░░░░░░░░░░░░░                             ║
+    ║           ░░░░░░░░░░░░░░░░░░░░░░░░░                         ║
+    ║        ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                      ║
+    ║       ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                     ║
+    ║      ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                    ║
+    ║     ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                   ║
+    ║    ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                  ║
+    ║   ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                 ║
+    ║    ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                  ║
+    ║     ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                   ║
+    ║      ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                    ║
+    ║       ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                     ║
+    ║        ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                      ║
+    ║           ░░░░░░░░░░░░░░░░░░░░░░░░░                         ║
+    ║              ░░░░░░░░░░░░░░░░░░░                             ║
+    ║                                                              ║
+    ║              ●  MOON ORBITING  ●                            ║
+    ╚══════════════════════════════════════════════════════════════╝
+            """,
+            "space_station": """
+    ╔══════════════════════════════════════════════════════════════╗
+    ║                                                              ║
+    ║                    ████████████████████████████████████████  ║
+    ║                  ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
+    ║                ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
+    ║              ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
+    ║            ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
+    ║          ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
+    ║        ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
+    ║      ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
+    ║    ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
+    ║  ████████████████████████████████████████████████████████████  ║
+    ╚══════════════════════════════════════════════════════════════╝
+            """,
+        }.items()
+    }
+)
+
+
+# Rows of the player status table as (label, value getter)
+_STATUS_FIELDS = (
+    ("Name", lambda p: p.name),
+    ("Level", lambda p: str(p.level)),
+    ("Health", lambda p: f"{p.health}/{p.max_health}"),
+    ("Energy", lambda p: f"{p.energy}/{p.max_energy}"),
+    ("Fuel", lambda p: f"{p.fuel}/{p.max_fuel}"),
+    ("Credits", lambda p: str(p.credits)),
+    ("Experience", lambda p: f"{p.experience}/{p.experience_to_next}"),
+)
+
+
+# TW2002 connection type -> (color, symbol)
+_CONN_TYPE_STYLE = {
+    "federation": ("green", "🟢"),
+    "neutral": ("yellow", "🟡"),
+    "enemy": ("red", "🔴"),
+    "hop": ("cyan", "🔵"),
+    "skip": ("magenta", "🟣"),
+    "warp": ("blue", "🔷"),
+}
+_DEFAULT_CONN_STYLE = ("white", "⚪")
+
+
+# Every state of the 30-cell progress bar, indexed by filled cell count
+_BAR_LENGTH = 30
+_PROGRESS_BARS = tuple("█" * i + "░" * (_BAR_LENGTH - i) for i in range(_BAR_LENGTH + 1))
+
+
+def _progress_bar(percent: float) -> str:
+    """Return the precomputed bar for a 0-100 percentage"""
+    filled = int(_BAR_LENGTH * percent / 100)
+    return _PROGRESS_BARS[min(max(filled, 0), _BAR_LENGTH)]
+
+
+class _LineBuffer:
+    """Collects output lines and emits them with a single console print"""
+
+    def __init__(self, console: Console):
+        self.console = console
+        self._lines: List[str] = []
+
+    def write(self, line: str = ""):
+        self._lines.append(line)
+
+    def flush(self):
+        if self._lines:
+            self.console.print("\n".join(self._lines))
+            self._lines = []
+
+
 class DisplayManager:
     """Handles game display and formatting"""
 
+    __slots__ = ("console", "_last_combat_sig", "_last_combat_panel", "_location_panel_cache")
+
     def __init__(self):
-        self.console = Console()
+        # The repr highlighter is only wanted on the status and inventory
+        # views, which opt back in per print
+        self.console = Console(highlight=False)
+        self._last_combat_sig = None
+        self._last_combat_panel = None
+        # (id(location), detailed) -> (content signature, Panel)
+        self._location_panel_cache: Dict[tuple, tuple] = {}
+
+    @property
+    def _tty(self) -> bool:
+        """Whether output goes to a terminal rather than a pipe, file or test buffer"""
+        return self.console.is_terminal
+
+    def _buffer(self) -> _LineBuffer:
+        """Start a line buffer bound to the current console"""
+        return _LineBuffer(self.console)
 
     def show_title(self, title: str, subtitle: str = ""):
         """Display a title with optional subtitle"""
-        title_text = Text(title, style="bold magenta")
+        title_text = Text(title, style=_STYLES["title"])
         if subtitle:
-            subtitle_text = Text(subtitle, style="cyan")
+            subtitle_text = Text(subtitle, style=_STYLES["subtitle"])
             self.console.print(title_text)
             self.console.print(subtitle_text)
         else:
@@ -37,20 +255,74 @@ class DisplayManager:
             self.console.print("[red]Unknown location[/red]")
             return
 
-        location_text = f"[bold cyan]{location.name}[/bold cyan] - Sector {location.sector}\n"
-        location_text += f"[italic]{location.description}[/italic]\n\n"
-        location_text += f"Type: {location.location_type.title()}\n"
-        location_text += f"Sector: {location.sector}\n"
-        location_text += f"Danger Level: {location.danger_level}/10\n"
-        location_text += f"Faction: {location.faction}\n"
+        self.console.print(self._location_panel(location, detailed=False))
+
+    def _location_panel(self, location, detailed: bool) -> Panel:
+        """Return the location panel, reusing the last one if the room is unchanged"""
+        # Location has mutable lists (items are picked up in place), so compare
+        # the displayed content rather than trusting an identity or version
+        signature = (
+            location.name,
+            location.description,
+            location.location_type,
+            location.sector,
+            location.danger_level,
+            location.faction,
+            tuple(location.services),
+            tuple(location.connections),
+            tuple((item.name, item.value) for item in location.items) if detailed else (),
+        )
+        key = (id(location), detailed)
+        cached = self._location_panel_cache.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        text = self._build_location_text(location, detailed)
+        if detailed:
+            panel = _panel_shell("Location Details", "cyan")(text)
+        else:
+            panel = _panel_shell("Location", "blue")(text)
+        self._location_panel_cache[key] = (signature, panel)
+        return panel
+
+    def _build_location_text(self, location, detailed: bool) -> Text:
+        """Build the location panel body shared by the summary and detail views"""
+        # Assembled from styled spans so no markup is parsed on room entry
+        text = Text.assemble(
+            (location.name, _STYLES["header_cyan"]),
+            f" - Sector {location.sector}\n",
+            "\n" if detailed else "",
+            (location.description, _STYLES["italic"]),
+            "\n\n",
+            f"{'Location Type' if detailed else 'Type'}: {_title(location.location_type)}\n",
+            f"Sector: {location.sector}\n",
+            f"Danger Level: {location.danger_level}/10\n",
+            f"Faction: {location.faction}\n",
+        )
+
+        if not detailed:
+            if location.services:
+                text.append(f"Services: {', '.join(location.services)}\n")
+            if location.connections:
+                text.append(f"Connected Sectors: {', '.join(location.connections)}\n")
+            return text
 
         if location.services:
-            location_text += f"Services: {', '.join(location.services)}\n"
+            text.append("\nAvailable Services:\n")
+            for service in location.services:
+                text.append(f"  • {_title(service)}\n")
 
         if location.connections:
-            location_text += f"Connected Sectors: {', '.join(location.connections)}\n"
+            text.append("\nConnected Sectors:\n")
+            for connection in location.connections:
+                text.append(f"  • {connection}\n")
+
+        if location.items:
+            text.append("\nItems Found Here:\n")
+            for item in location.items:
+                text.append(f"  • {item.name} ({item.value} credits)\n")
 
-        self.console.print(Panel(location_text, title="Location", border_style="blue"))
+        return text
 
     def show_status(self, player: Player, achievements: List[str] = None):
         """Display player status"""
@@ -62,13 +334,8 @@ class DisplayManager:
         status_table.add_column("Stat", style="yellow")
         status_table.add_column("Value", style="white")
 
-        status_table.add_row("Name", player.name)
-        status_table.add_row("Level", str(player.level))
-        status_table.add_row("Health", f"{player.health}/{player.max_health}")
-        status_table.add_row("Energy", f"{player.energy}/{player.max_energy}")
-        status_table.add_row("Fuel", f"{player.fuel}/{player.max_fuel}")
-        status_table.add_row("Credits", str(player.credits))
-        status_table.add_row("Experience", f"{player.experience}/{player.experience_to_next}")
+        for label, value in _STATUS_FIELDS:
+            status_table.add_row(label, value(player))
 
         if getattr(player, "titles", None):
             status_table.add_row("Titles", ", ".join(player.titles))
@@ -78,7 +345,8 @@ class DisplayManager:
             ", ".join(achievements) if achievements else "None",
         )
 
-        self.console.print(status_table)
+        # The repr highlighter only adds colour, which redirected output drops anyway
+        self.console.print(status_table, highlight=self._tty)
 
     def show_detailed_status(self, player: Player):
         """Display detailed player status"""
@@ -86,40 +354,38 @@ class DisplayManager:
             return
 
         # Create detailed status panel
-        status_text = f"[bold cyan]{player.name}[/bold cyan] - Level {player.level}\n\n"
+        parts = [f"[bold cyan]{player.name}[/bold cyan] - Level {player.level}\n\n"]
 
         # Core stats
-        stats_text = "[bold yellow]Core Stats:[/bold yellow]\n"
+        parts.append("[bold yellow]Core Stats:[/bold yellow]\n")
         for stat, value in player.stats.items():
-            stats_text += f"  {stat.title()}: {value}\n"
+            parts.append(f"  {_title(stat)}: {value}\n")
 
         # Combat stats
-        combat_text = "\n[bold yellow]Combat Stats:[/bold yellow]\n"
-        combat_text += f"  Health: {player.health}/{player.max_health}\n"
-        combat_text += f"  Energy: {player.energy}/{player.max_energy}\n"
-        combat_text += f"  Damage: {player.get_total_damage()}\n"
-        combat_text += f"  Defense: {player.get_total_defense()}\n"
+        parts.append("\n[bold yellow]Combat Stats:[/bold yellow]\n")
+        parts.append(f"  Health: {player.health}/{player.max_health}\n")
+        parts.append(f"  Energy: {player.energy}/{player.max_energy}\n")
+        parts.append(f"  Damage: {player.get_total_damage()}\n")
+        parts.append(f"  Defense: {player.get_total_defense()}\n")
 
         # Skills
-        skills_text = "\n[bold yellow]Skills:[/bold yellow]\n"
+        parts.append("\n[bold yellow]Skills:[/bold yellow]\n")
         for skill_name, skill in player.skills.items():
-            skills_text += f"  {skill.name}: {skill.level}\n"
+            parts.append(f"  {skill.name}: {skill.level}\n")
 
         # Ship info
-        ship_text = "\n[bold yellow]Ship:[/bold yellow]\n"
-        ship_text += f"  Name: {player.ship['name']}\n"
-        ship_text += f"  Class: {player.ship['class']}\n"
-        ship_text += f"  Cargo Capacity: {player.ship['cargo_capacity']}\n"
-        ship_text += f"  Fuel Efficiency: {player.ship['fuel_efficiency']}\n"
+        parts.append("\n[bold yellow]Ship:[/bold yellow]\n")
+        parts.append(f"  Name: {player.ship['name']}\n")
+        parts.append(f"  Class: {player.ship['class']}\n")
+        parts.append(f"  Cargo Capacity: {player.ship['cargo_capacity']}\n")
+        parts.append(f"  Fuel Efficiency: {player.ship['fuel_efficiency']}\n")
 
         # Reputation
-        rep_text = "\n[bold yellow]Reputation:[/bold yellow]\n"
+        parts.append("\n[bold yellow]Reputation:[/bold yellow]\n")
         for faction, rep in player.reputation.items():
-            rep_text += f"  {faction}: {rep}\n"
-
-        full_status = status_text + stats_text + combat_text + skills_text + ship_text + rep_text
+            parts.append(f"  {faction}: {rep}\n")
 
-        self.console.print(Panel(full_status, title="Detailed Status", border_style="green"))
+        self.console.print(Panel("".join(parts), title="Detailed Status", border_style="green"))
 
     def show_inventory(self, player: Player):
         """Display player inventory"""
@@ -137,36 +403,44 @@ class DisplayManager:
         inventory_table.add_column("Value", style="green")
         inventory_table.add_column("Description", style="white")
 
+        # Pre-built Text cells skip Rich's markup parsing for every cell
+        add_row = inventory_table.add_row
         for item in player.inventory:
-            inventory_table.add_row(
-                item.name, item.item_type.title(), str(item.value), item.description
+            add_row(
+                Text(item.name),
+                Text(_title(item.item_type)),
+                Text(str(item.value)),
+                Text(item.description),
             )
 
-        self.console.print(inventory_table)
-
-        # Show equipped items
-        if any(player.equipped.values()):
-            equipped_text = "\n[bold yellow]Equipped Items:[/bold yellow]\n"
-            for slot, item in player.equipped.items():
-                if item:
-                    equipped_text += f"  {slot.title()}: {item.name}\n"
-                else:
-                    equipped_text += f"  {slot.title()}: None\n"
+        # Show equipped items in the same print as the table, gathered in one
+        # pass over the slots
+        parts = ["\n[bold yellow]Equipped Items:[/bold yellow]\n"]
+        has_equipped = False
+        for slot, item in player.equipped.items():
+            if item:
+                has_equipped = True
+                parts.append(f"  {_title(slot)}: {item.name}\n")
+            else:
+                parts.append(f"  {_title(slot)}: None\n")
 
-            self.console.print(equipped_text)
+        if has_equipped:
+            self.console.print(Group(inventory_table, "".join(parts)), highlight=self._tty)
+        else:
+            self.console.print(inventory_table, highlight=self._tty)
 
     def show_event_result(self, event: Dict):
         """Display the outcome of a random event"""
         if not event:
             return
 
-        event_text = f"[bold magenta]{event.get('name', 'Event')}[/bold magenta]\n"
+        parts = [f"[bold magenta]{event.get('name', 'Event')}[/bold magenta]\n"]
         if event.get("description"):
-            event_text += f"{event['description']}\n"
+            parts.append(f"{event['description']}\n")
         if event.get("outcome"):
-            event_text += f"\n[bold]Outcome:[/bold] {event['outcome']}"
+            parts.append(f"\n[bold]Outcome:[/bold] {event['outcome']}")
 
-        self.console.print(Panel(event_text, title="Event", border_style="magenta"))
+        self.console.print(Panel("".join(parts), title="Event", border_style="magenta"))
 
     def show_location_description(self, location):
         """Display detailed location description"""
@@ -174,59 +448,53 @@ class DisplayManager:
             self.console.print("[red]Unknown location[/red]")
             return
 
-        desc_text = f"[bold cyan]{location.name}[/bold cyan] - Sector {location.sector}\n\n"
-        desc_text += f"[italic]{location.description}[/italic]\n\n"
-
-        desc_text += f"Location Type: {location.location_type.title()}\n"
-        desc_text += f"Sector: {location.sector}\n"
-        desc_text += f"Danger Level: {location.danger_level}/10\n"
-        desc_text += f"Faction: {location.faction}\n"
-
-        if location.services:
-            desc_text += f"\nAvailable Services:\n"
-            for service in location.services:
-                desc_text += f"  • {service.title()}\n"
-
-        if location.connections:
-            desc_text += f"\nConnected Sectors:\n"
-            for connection in location.connections:
-                desc_text += f"  • {connection}\n"
-
-        if location.items:
-            desc_text += f"\nItems Found Here:\n"
-            for item in location.items:
-                desc_text += f"  • {item.name} ({item.value} credits)\n"
-
-        self.console.print(Panel(desc_text, title="Location Details", border_style="cyan"))
+        self.console.print(self._location_panel(location, detailed=True))
 
     def show_combat_status(self, combat_data: Dict):
         """Display combat status"""
         if not combat_data.get("in_combat"):
             return
 
-        # Create combat panel
-        combat_text = f"[bold red]COMBAT ROUND {combat_data['round']}[/bold red]\n\n"
-
-        # Enemy info
+        # Create combat panel from styled spans; this redraws every combat round,
+        # so reuse the last panel when nothing shown in it has changed
         enemy = combat_data["enemy"]
-        combat_text += f"[bold yellow]Enemy: {enemy['name']}[/bold yellow]\n"
-        combat_text += f"Health: {enemy['health']}/{enemy['max_health']}\n"
-        combat_text += f"Description: {enemy['description']}\n\n"
-
-        # Player info
         player = combat_data["player"]
-        combat_text += (
-            f"[bold green]Your Health: {player['health']}/{player['max_health']}[/bold green]\n"
+        sig = (
+            combat_data["round"],
+            enemy["name"],
+            enemy["health"],
+            player["health"],
+            player["energy"],
+            tuple(combat_data.get("log") or ()),
+        )
+        if sig == self._last_combat_sig:
+            self.console.print(self._last_combat_panel)
+            return
+
+        combat_text = Text.assemble(
+            (f"COMBAT ROUND {combat_data['round']}", _STYLES["header_red"]),
+            "\n\n",
+            # Enemy info
+            (f"Enemy: {enemy['name']}", _STYLES["header_yellow"]),
+            "\n",
+            f"Health: {enemy['health']}/{enemy['max_health']}\n",
+            f"Description: {enemy['description']}\n\n",
+            # Player info
+            (f"Your Health: {player['health']}/{player['max_health']}", _STYLES["header_green"]),
+            "\n",
+            f"Energy: {player['energy']}/{player['max_energy']}\n\n",
         )
-        combat_text += f"Energy: {player['energy']}/{player['max_energy']}\n\n"
 
         # Combat log
         if combat_data.get("log"):
-            combat_text += "[bold cyan]Recent Actions:[/bold cyan]\n"
+            combat_text.append("Recent Actions:", _STYLES["header_cyan"])
+            combat_text.append("\n")
             for action in combat_data["log"]:
-                combat_text += f"  {action}\n"
+                combat_text.append(f"  {action}\n")
 
-        self.console.print(Panel(combat_text, title="Combat", border_style="red"))
+        self._last_combat_sig = sig
+        self._last_combat_panel = Panel(combat_text, title="Combat", border_style="red")
+        self.console.print(self._last_combat_panel)
 
     def show_market_info(self, market_data: Dict):
         """Display market information"""
@@ -234,28 +502,28 @@ class DisplayManager:
             self.console.print("[dim]No market available here[/dim]")
             return
 
-        market_text = f"[bold cyan]Market Information[/bold cyan]\n\n"
+        parts = ["[bold cyan]Market Information[/bold cyan]\n\n"]
 
         condition = market_data.get("market_condition")
         if condition:
-            market_text += f"Condition: {condition.title()}\n"
+            parts.append(f"Condition: {_title(condition)}\n")
         if market_data.get("specialization"):
-            market_text += f"Specialization: {market_data['specialization'].title()}\n"
+            parts.append(f"Specialization: {_title(market_data['specialization'])}\n")
         if "price_modifier" in market_data:
-            market_text += f"Price Modifier: {market_data['price_modifier']:.1f}x\n"
+            parts.append(f"Price Modifier: {market_data['price_modifier']:.1f}x\n")
         if market_data.get("trade_volume"):
-            market_text += f"Trade Volume: {market_data['trade_volume'].title()}\n"
+            parts.append(f"Trade Volume: {_title(market_data['trade_volume'])}\n")
         if market_data.get("security"):
-            market_text += f"Security: {market_data['security'].title()}\n"
+            parts.append(f"Security: {_title(market_data['security'])}\n")
 
-        market_text += "\n"
+        parts.append("\n")
 
-        market_text += "[bold yellow]Available Goods:[/bold yellow]\n"
+        parts.append("[bold yellow]Available Goods:[/bold yellow]\n")
         for good in market_data["goods"]:
-            market_text += f"  • {good['name']}: {good['price']} credits\n"
-            market_text += f"    {good['description']}\n"
+            parts.append(f"  • {good['name']}: {good['price']} credits\n")
+            parts.append(f"    {good['description']}\n")
 
-        self.console.print(Panel(market_text, title="Market", border_style="green"))
+        self.console.print(Panel("".join(parts), title="Market", border_style="green"))
 
     def show_trade_opportunities(self, opportunities: List[Dict]):
         """Display trade opportunities"""
@@ -263,12 +531,15 @@ class DisplayManager:
             self.console.print("[dim]No trade opportunities available[/dim]")
             return
 
-        self.console.print("\n[bold cyan]Trade Opportunities[/bold cyan]")
-        self.console.print("=" * 50)
+        buf = self._buffer()
+        buf.write("\n[bold cyan]Trade Opportunities[/bold cyan]")
+        buf.write("=" * 50)
 
         for i, opp in enumerate(opportunities, 1):
             action = "Buy" if opp["type"] == "buy" else "Sell"
-            self.console.print(f"{i}. {action} {opp['item']} for {opp['price']} credits")
+            buf.write(f"{i}. {action} {opp['item']} for {opp['price']} credits")
+
+        buf.flush()
 
     def show_trade_history(self, history: List[Dict]):
         """Display trade history"""
@@ -276,45 +547,48 @@ class DisplayManager:
             self.console.print("[dim]No trade history available[/dim]")
             return
 
-        self.console.print("\n[bold cyan]Trade History[/bold cyan]")
-        self.console.print("=" * 50)
+        buf = self._buffer()
+        buf.write("\n[bold cyan]Trade History[/bold cyan]")
+        buf.write("=" * 50)
 
         for trade in history:
             action = "Bought" if trade["type"] == "buy" else "Sold"
-            self.console.print(
+            buf.write(
                 f"{action} {trade['quantity']} {trade['item']} at {trade['location']} for {trade['amount']} credits"
             )
 
+        buf.flush()
+
     def show_travel_info(self, travel_info):
         """Display travel information"""
         if not travel_info.get("available"):
             self.console.print("[red]Cannot travel to this destination[/red]")
             return
 
-        travel_text = f"[bold cyan]Jump Information[/bold cyan]\n\n"
-        travel_text += f"Destination: {travel_info['destination']}\n"
-        travel_text += f"Sector: {travel_info['sector']}\n"
-        travel_text += f"Fuel Cost: {travel_info['fuel_cost']}\n"
-        travel_text += f"Jump Time: {travel_info['travel_time']} minutes\n"
-        travel_text += f"Danger Level: {travel_info['danger_level']}/10\n"
-        travel_text += f"Faction: {travel_info['faction']}\n"
+        parts = [
+            "[bold cyan]Jump Information[/bold cyan]\n\n",
+            f"Destination: {travel_info['destination']}\n",
+            f"Sector: {travel_info['sector']}\n",
+            f"Fuel Cost: {travel_info['fuel_cost']}\n",
+            f"Jump Time: {travel_info['travel_time']} minutes\n",
+            f"Danger Level: {travel_info['danger_level']}/10\n",
+            f"Faction: {travel_info['faction']}\n",
+        ]
 
         if travel_info.get("services"):
-            travel_text += f"\nServices: {', '.join(travel_info['services'])}\n"
+            parts.append(f"\nServices: {', '.join(travel_info['services'])}\n")
 
-        self.console.print(Panel(travel_text, title="Jump Info", border_style="blue"))
+        self.console.print(Panel("".join(parts), title="Jump Info", border_style="blue"))
 
     def show_travel_progress(self, progress: float, destination: str, remaining_time: float):
         """Display travel progress"""
-        progress_text = f"[bold yellow]Jumping to {destination}[/bold yellow]\n\n"
-        progress_text += f"Progress: {progress:.1f}%\n"
-        progress_text += f"Remaining Time: {remaining_time:.1f} minutes\n"
-
-        # Create a simple progress bar
-        bar_length = 30
-        filled_length = int(bar_length * progress / 100)
-        bar = "█" * filled_length + "░" * (bar_length - filled_length)
-        progress_text += f"[{bar}] {progress:.1f}%"
+        progress_text = (
+            f"[bold yellow]Jumping to {destination}[/bold yellow]\n\n"
+            f"Progress: {progress:.1f}%\n"
+            f"Remaining Time: {remaining_time:.1f} minutes\n"
+            # Create a simple progress bar
+            f"[{_progress_bar(progress)}] {progress:.1f}%"
+        )
 
         self.console.print(Panel(progress_text, title="Jump Progress", border_style="yellow"))
 
@@ -324,156 +598,45 @@ class DisplayManager:
             self.console.print("[dim]No quests available[/dim]")
             return
 
-        quest_text = "[bold cyan]Available Quests[/bold cyan]\n\n"
+        parts = ["[bold cyan]Available Quests[/bold cyan]\n\n"]
 
         for i, quest in enumerate(quests, 1):
-            quest_text += f"[bold yellow]{i}. {quest.name}[/bold yellow]\n"
-            quest_text += f"   Type: {quest.quest_type.title()}\n"
-            quest_text += f"   Difficulty: {quest.difficulty}/10\n"
-            quest_text += f"   Faction: {quest.faction}\n"
-            quest_text += f"   Description: {quest.description}\n"
+            parts.append(f"[bold yellow]{i}. {quest.name}[/bold yellow]\n")
+            parts.append(f"   Type: {_title(quest.quest_type)}\n")
+            parts.append(f"   Difficulty: {quest.difficulty}/10\n")
+            parts.append(f"   Faction: {quest.faction}\n")
+            parts.append(f"   Description: {quest.description}\n")
 
             if quest.rewards:
-                quest_text += "   Rewards: "
                 rewards = []
                 if "experience" in quest.rewards:
                     rewards.append(f"{quest.rewards['experience']} XP")
                 if "credits" in quest.rewards:
                     rewards.append(f"{quest.rewards['credits']} credits")
-                quest_text += ", ".join(rewards) + "\n"
+                parts.append(f"   Rewards: {', '.join(rewards)}\n")
 
-            quest_text += "\n"
+            parts.append("\n")
 
-        self.console.print(Panel(quest_text, title="Quests", border_style="yellow"))
+        self.console.print(Panel("".join(parts), title="Quests", border_style="yellow"))
 
     def show_help(self):
         """Display help information"""
-        help_text = """
-[bold cyan]StellarOdyssey2080 - Game Controls[/bold cyan]
-
-[bold yellow]Movement:[/bold yellow]
-• north, south, east, west (or n, s, e, w)
-• up, down, in, out
-
-[bold yellow]Actions:[/bold yellow]
-• look, examine, search
-• take, drop, use, inventory
-• talk, ask, say
-
-[bold yellow]Combat:[/bold yellow]
-• attack, defend, flee
-• use [weapon/item]
-
-[bold yellow]Space Travel:[/bold yellow]
-• travel [destination]
-• land, takeoff
-• scan, navigate
-• map (show space map)
-
-[bold yellow]Trading:[/bold yellow]
-• buy [item], sell [item]
-• trade, market
-• trade routes (show best routes)
-• trade history
-
-[bold yellow]System:[/bold yellow]
-• status, stats
-• save, load, quit
-• help
-
-[bold yellow]Special Commands:[/bold yellow]
-• quests, missions
-• skills, abilities
-• equipment, ship
-        """
-
-        self.console.print(Panel(help_text, title="Help", border_style="blue"))
+        self.console.print(_HELP_PANEL)
 
     def show_ascii_art(self, art_type: str):
         """Display ASCII art"""
-        art_pieces = {
-            "ship": """
-    ╔══════════════════════════════════════════════════════════════╗
-    ║                    🚀 STARFARER CLASS VESSEL 🚀              ║
-    ║                                                              ║
-    ║                    ▄▄▄▄▄▄▄                                   ║
-    ║                  ▄███████████▄                                ║
-    ║                ▄███████████████▄                              ║
-    ║              ▄███████████████████▄                            ║
-    ║            ▄███████████████████████▄                          ║
-    ║          ▄███████████████████████████▄                        ║
-    ║        ▄███████████████████████████████▄                      ║
-    ║      ▄███████████████████████████████████▄                    ║
-    ║    ▄███████████████████████████████████████▄                  ║
-    ║  ▄███████████████████████████████████████████▄                ║
-    ║ ███████████████████████████████████████████████               ║
-    ║ ███████████████████████████████████████████████               ║
-    ║  ▀████████████████████████████████████████████▀               ║
-    ║    ▀████████████████████████████████████████▀                 ║
-    ║      ▀████████████████████████████████████▀                   ║
-    ║        ▀████████████████████████████████▀                     ║
-    ║          ▀████████████████████████████▀                       ║
-    ║            ▀████████████████████████▀                         ║
-    ║              ▀████████████████████▀                           ║
-    ║                ▀████████████████▀                             ║
-    ║                  ▀████████████▀                               ║
-    ║                    ▀▀▀▀▀▀▀▀▀                                 ║
-    ║                                                              ║
-    ║         ════ ENGINE THRUSTERS ACTIVE ════                    ║
-    ╚══════════════════════════════════════════════════════════════╝
-            """,
-            "planet": """
-    ╔══════════════════════════════════════════════════════════════╗
-    ║                  🌍 PLANETARY SYSTEM 🌍                      ║
-    ║                                                              ║
-    ║              ░░░░░░░░░░░░░░░░░░░                             ║
-    ║           ░░░░░░░░░░░░░░░░░░░░░░░░░                         ║
-    ║        ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                      ║
-    ║       ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                     ║
-    ║      ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                    ║
-    ║     ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                   ║
-    ║    ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                  ║
-    ║   ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                 ║
-    ║    ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                  ║
-    ║     ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                   ║
-    ║      ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                    ║
-    ║       ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                     ║
-    ║        ░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░                      ║
-    ║           ░░░░░░░░░░░░░░░░░░░░░░░░░                         ║
-    ║              ░░░░░░░░░░░░░░░░░░░                             ║
-    ║                                                              ║
-    ║              ●  MOON ORBITING  ●                            ║
-    ╚══════════════════════════════════════════════════════════════╝
-            """,
-            "space_station": """
-    ╔══════════════════════════════════════════════════════════════╗
-    ║                                                              ║
-    ║                    ████████████████████████████████████████  ║
-    ║                  ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
-    ║                ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
-    ║              ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
-    ║            ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
-    ║          ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
-    ║        ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
-    ║      ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
-    ║    ██░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░░██  ║
-    ║  ████████████████████████████████████████████████████████████  ║
-    ╚══════════════════════════════════════════════════════════════╝
-            """,
-        }
-
-        if art_type in art_pieces:
-            self.console.print(art_pieces[art_type], style="cyan")
+        # Purely decorative, so skip it when output is redirected
+        if not self._tty:
+            return
+        art = _ART.get(art_type)
+        if art:
+            self.console.print(art)
 
     def show_progress_bar(self, title: str, current: int, maximum: int):
         """Show a progress bar"""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=self.console,
-        ) as progress:
-            task = progress.add_task(title, total=maximum)
-            progress.update(task, completed=current)
+        # One-shot snapshot, so render the bar directly instead of a live Progress
+        percent = current * 100.0 / maximum if maximum else 0.0
+        self.console.print(f"{title} [{_progress_bar(percent)}] {percent:.1f}%")
 
     def clear_screen(self):
         """Clear the console screen"""
@@ -485,22 +648,33 @@ class DisplayManager:
             self.console.print("[dim]Sector not yet discovered[/dim]")
             return
 
-        sector_text = f"[bold cyan]Sector: {sector_info['name']}[/bold cyan]\n\n"
-        sector_text += f"Locations: {', '.join(sector_info['locations'])}\n"
-        sector_text += f"Danger Level: {sector_info['danger_level']}/10\n"
-        sector_text += f"Factions: {', '.join(sector_info['factions'])}\n"
+        sector_text = (
+            f"[bold cyan]Sector: {sector_info['name']}[/bold cyan]\n\n"
+            f"Locations: {', '.join(sector_info['locations'])}\n"
+            f"Danger Level: {sector_info['danger_level']}/10\n"
+            f"Factions: {', '.join(sector_info['factions'])}\n"
+        )
 
         self.console.print(Panel(sector_text, title="Sector Information", border_style="green"))
 
     def show_sector_map(self, sectors, discovered_sectors):
         """Display a map of all sectors"""
-        map_text = "[bold cyan]Galactic Sector Map[/bold cyan]\n\n"
+        if not isinstance(discovered_sectors, (set, frozenset)):
+            discovered_sectors = set(discovered_sectors)
 
+        map_text = Text()
+        map_text.append("Galactic Sector Map", _STYLES["header_cyan"])
+        map_text.append("\n\n")
+
+        # One styled span per sector instead of a markup tag pair per line
+        discovered_style = _STYLES["discovered"]
+        undiscovered_style = _STYLES["dim"]
         for sector in sectors:
             if sector in discovered_sectors:
-                map_text += f"[green]✓ {sector}[/green]\n"
+                map_text.append(f"✓ {sector}", discovered_style)
             else:
-                map_text += f"[dim]? {sector} (Undiscovered)[/dim]\n"
+                map_text.append(f"? {sector} (Undiscovered)", undiscovered_style)
+            map_text.append("\n")
 
         self.console.print(Panel(map_text, title="Sector Map", border_style="cyan"))
 
@@ -510,13 +684,13 @@ class DisplayManager:
             adj = world.get_surface_adjacent()
             if adj:
                 adj_text = "[bold cyan]Adjacent Areas:[/bold cyan] "
-                adj_text += ", ".join([f"{dir.title()}" for dir in adj.keys()])
+                adj_text += ", ".join(_title(direction) for direction in adj)
                 self.console.print(adj_text)
         else:
             current_location = world.get_current_location()
             if current_location and current_location.connections:
                 adj_text = "[bold cyan]Adjacent Sectors:[/bold cyan] "
-                adj_text += ", ".join([f"[{sector}]" for sector in current_location.connections])
+                adj_text += "[" + "], [".join(current_location.connections) + "]"
                 self.console.print(adj_text)
 
     def show_space_instructions(self, world):
@@ -533,32 +707,36 @@ class DisplayManager:
 
     def show_planet_surface(self, world):
         """Show the planetary surface map and current area description"""
-        self.console.print(world.get_surface_map())
+        buf = self._buffer()
+        buf.write(world.get_surface_map())
         area = world.get_surface_area()
         if area:
             desc = area.get("desc", "Unknown area")
             terrain = area.get("terrain", "unknown")
-            self.console.print(f"[bold cyan]Current Area:[/bold cyan] {desc} ({terrain})")
+            buf.write(f"[bold cyan]Current Area:[/bold cyan] {desc} ({terrain})")
             if area.get("items"):
-                item_names = ", ".join([item.name for item in area["items"]])
-                self.console.print(f"[green]Items:[/green] {item_names}")
+                item_names = ", ".join(item.name for item in area["items"])
+                buf.write(f"[green]Items:[/green] {item_names}")
             if area.get("npcs"):
                 npc_names = ", ".join(area["npcs"])
-                self.console.print(f"[cyan]NPCs:[/cyan] {npc_names}")
+                buf.write(f"[cyan]NPCs:[/cyan] {npc_names}")
             if area.get("resource"):
-                self.console.print(f"[yellow]Resource Node:[/yellow] {area['resource']}")
+                buf.write(f"[yellow]Resource Node:[/yellow] {area['resource']}")
+        buf.flush()
 
     def show_planet_surface_instructions(self, world):
         """Show contextual instructions for planetary surface movement"""
+        buf = self._buffer()
         adj = world.get_surface_adjacent()
         if adj:
             adj_text = "[bold cyan]You can move:[/bold cyan] " + ", ".join(
-                [dir.title() for dir in adj.keys()]
+                _title(direction) for direction in adj
             )
-            self.console.print(adj_text)
-        self.console.print(
+            buf.write(adj_text)
+        buf.write(
             "[yellow]Use n/s/e/w to move, 'take <item>' to pick up, 'talk <npc>' to interact, 'gather' to collect resources, 'leave' or 'orbit' to return to space. Type 'look' to examine area.[/yellow]"
         )
+        buf.flush()
 
     def show_tw2002_sector_display(self, world):
         """Display TW2002-style sector information"""
@@ -568,42 +746,40 @@ class DisplayManager:
             self.console.print(f"[red]{sector_display['error']}[/red]")
             return
 
-        # Create the main sector display
-        sector_text = f"\n[bold cyan]SECTOR {sector_display['sector']}[/bold cyan]\n"
-        sector_text += f"[bold yellow]Location:[/bold yellow] {sector_display['location']}\n"
-        sector_text += f"[bold yellow]Faction:[/bold yellow] {sector_display['faction']}\n"
-        sector_text += f"[bold yellow]Status:[/bold yellow] {'Discovered' if sector_display['discovered'] else 'Unexplored'}\n\n"
+        # Create the main sector display from styled spans; redrawn on every jump
+        header = _STYLES["header_yellow"]
+        sector_text = Text.assemble(
+            "\n",
+            (f"SECTOR {sector_display['sector']}", _STYLES["header_cyan"]),
+            "\n",
+            ("Location:", header),
+            f" {sector_display['location']}\n",
+            ("Faction:", header),
+            f" {sector_display['faction']}\n",
+            ("Status:", header),
+            f" {'Discovered' if sector_display['discovered'] else 'Unexplored'}\n\n",
+        )
 
         # Show connected sectors with types
         if sector_display["connections"]:
-            sector_text += "[bold yellow]Connected Sectors:[/bold yellow]\n"
+            sector_text.append("Connected Sectors:", header)
+            sector_text.append("\n")
             for conn in sector_display["connections"]:
                 # Color code based on connection type
-                if conn["type"] == "federation":
-                    type_color = "green"
-                    type_symbol = "🟢"
-                elif conn["type"] == "neutral":
-                    type_color = "yellow"
-                    type_symbol = "🟡"
-                elif conn["type"] == "enemy":
-                    type_color = "red"
-                    type_symbol = "🔴"
-                elif conn["type"] == "hop":
-                    type_color = "cyan"
-                    type_symbol = "🔵"
-                elif conn["type"] == "skip":
-                    type_color = "magenta"
-                    type_symbol = "🟣"
-                elif conn["type"] == "warp":
-                    type_color = "blue"
-                    type_symbol = "🔷"
-                else:
-                    type_color = "white"
-                    type_symbol = "⚪"
-
-                sector_text += f"  {type_symbol} Sector {conn['sector']} ({conn['type'].upper()}) - {conn['faction']}\n"
-                sector_text += f"     Fuel: {conn['fuel_cost']}, Time: {conn['travel_time']}min, Danger: {conn['danger_level']}/10\n"
+                type_color, type_symbol = _CONN_TYPE_STYLE.get(conn["type"], _DEFAULT_CONN_STYLE)
+
+                sector_text.append(
+                    f"  {type_symbol} Sector {conn['sector']} ({conn['type'].upper()}) - {conn['faction']}\n"
+                )
+                sector_text.append(
+                    f"     Fuel: {conn['fuel_cost']}, Time: {conn['travel_time']}min, Danger: {conn['danger_level']}/10\n"
+                )
         else:
-            sector_text += "[dim]No connected sectors[/dim]\n"
+            sector_text.append("No connected sectors", _STYLES["dim"])
+            sector_text.append("\n")
 
         self.console.print(Panel(sector_text, title="TW2002 Navigation", border_style="cyan"))
+
+
+# Shared instance so callers reuse one Console rather than probing the terminal again
+display_manager = DisplayManager()
@@ -4,18 +4,66 @@ Handles player input and command processing
 """
 
 import re
+from bisect import bisect_left
+from collections import deque
 from typing import List, Dict, Optional, Tuple
 from rich.prompt import Prompt
 from rich.console import Console
 
+# Command words highlighted by format_command; the group name is the colour
+_HIGHLIGHT_RE = re.compile(
+    r"\b(?P<cyan>north|south|east|west|n|s|e|w)\b"
+    r"|\b(?P<yellow>look|inventory|status|attack|travel|buy|sell)\b"
+    r"|\b(?P<red>help|quit|save|load)\b"
+)
+
+
+def _colorize(match: re.Match) -> str:
+    color = match.lastgroup
+    return f"[{color}]{match.group()}[/{color}]"
+
 
 class InputHandler:
     """Handles player input and command processing"""
 
+    __slots__ = (
+        "console",
+        "max_history",
+        "command_history",
+        "commands",
+        "aliases",
+        "_all_commands",
+        "_all_commands_sorted",
+        "_category_rank",
+        "_sorted_cmds",
+        "_action_map",
+        "_ctx_suggestions",
+    )
+
+    # Help text for individual commands, shared by every handler
+    _HELP_TEXTS = {
+        "north": "Move north (also: n)",
+        "south": "Move south (also: s)",
+        "east": "Move east (also: e)",
+        "west": "Move west (also: w)",
+        "look": "Examine your surroundings",
+        "inventory": "Show your inventory (also: inv, i)",
+        "status": "Show your status (also: stats, s)",
+        "attack": "Attack an enemy",
+        "defend": "Take defensive stance",
+        "flee": "Attempt to flee from combat",
+        "travel": "Travel to another location",
+        "buy": "Buy an item from the market",
+        "sell": "Sell an item to the market",
+        "quests": "Show available quests",
+        "help": "Show this help (also: h)",
+        "quit": "Exit the game (also: q, exit)",
+    }
+
     def __init__(self):
         self.console = Console()
-        self.command_history = []
         self.max_history = 50
+        self.command_history = deque(maxlen=self.max_history)
 
         # Define available commands
         self.commands = {
@@ -71,16 +119,39 @@ class InputHandler:
             "exit": "quit",
         }
 
+        # Flat command lookups, built once instead of walking the categories per call
+        self._all_commands = frozenset(cmd for cmds in self.commands.values() for cmd in cmds)
+        self._all_commands_sorted = sorted(self._all_commands)
+
+        # First position of each command in category order, for suggestions
+        self._category_rank = {}
+        for cmds in self.commands.values():
+            for cmd in cmds:
+                self._category_rank.setdefault(cmd, len(self._category_rank))
+        self._sorted_cmds = sorted(self._all_commands | set(self.aliases))
+
+        # Every command and alias mapped to its canonical action
+        self._action_map = {cmd: cmd for cmd in self._all_commands}
+        self._action_map.update(self.aliases)
+
+        # Context hints for suggest_command, capped at 10 like its result
+        self._ctx_suggestions = {
+            "combat": tuple(self.commands["combat"][:10]),
+            "trading": tuple(self.commands["trading"][:10]),
+            "movement": tuple(self.commands["movement"][:10]),
+            "exploration": tuple((self.commands["actions"] + self.commands["travel"])[:10]),
+            # General suggestions: top 3 from each category
+            None: tuple([cmd for cmds in self.commands.values() for cmd in cmds[:3]][:10]),
+        }
+
     def get_input(self, prompt: str = "> ") -> str:
         """Get input from the player"""
         try:
             command = Prompt.ask(prompt).strip()
 
-            # Add to history
+            # Add to history; the deque drops the oldest entry once full
             if command:
                 self.command_history.append(command)
-                if len(self.command_history) > self.max_history:
-                    self.command_history.pop(0)
 
             return command
         except KeyboardInterrupt:
@@ -98,12 +169,10 @@ class InputHandler:
         if not parts:
             return "", []
 
+        # Resolve aliases; unknown words pass through for validation to report
         action = parts[0].lower()
-        args = parts[1:] if len(parts) > 1 else []
-
-        # Resolve aliases
-        if action in self.aliases:
-            action = self.aliases[action]
+        action = self._action_map.get(action, action)
+        args = parts[1:]
 
         return action, args
 
@@ -112,14 +181,11 @@ class InputHandler:
         if not partial_command:
             return []
 
-        suggestions = []
         partial_lower = partial_command.lower()
 
-        # Check all command categories
-        for category, commands in self.commands.items():
-            for cmd in commands:
-                if cmd.startswith(partial_lower):
-                    suggestions.append(cmd)
+        # Check all commands, listed in category order
+        matches = self._prefix_matches(self._all_commands_sorted, partial_lower, None)
+        suggestions = sorted(matches, key=self._category_rank.__getitem__)[:10]
 
         # Check aliases
         for alias, full_command in self.aliases.items():
@@ -133,11 +199,7 @@ class InputHandler:
         result = {"valid": True, "action": action, "args": args, "message": "", "suggestions": []}
 
         # Check if action is recognized
-        all_commands = []
-        for commands in self.commands.values():
-            all_commands.extend(commands)
-
-        if action not in all_commands:
+        if action not in self._action_map:
             result["valid"] = False
             result["message"] = f"Unknown command: {action}"
             result["suggestions"] = self.get_command_suggestions(action)
@@ -163,26 +225,7 @@ class InputHandler:
 
     def get_help_for_command(self, command: str) -> str:
         """Get help text for a specific command"""
-        help_texts = {
-            "north": "Move north (also: n)",
-            "south": "Move south (also: s)",
-            "east": "Move east (also: e)",
-            "west": "Move west (also: w)",
-            "look": "Examine your surroundings",
-            "inventory": "Show your inventory (also: inv, i)",
-            "status": "Show your status (also: stats, s)",
-            "attack": "Attack an enemy",
-            "defend": "Take defensive stance",
-            "flee": "Attempt to flee from combat",
-            "travel": "Travel to another location",
-            "buy": "Buy an item from the market",
-            "sell": "Sell an item to the market",
-            "quests": "Show available quests",
-            "help": "Show this help (also: h)",
-            "quit": "Exit the game (also: q, exit)",
-        }
-
-        return help_texts.get(command, f"No help available for '{command}'")
+        return self._HELP_TEXTS.get(command, f"No help available for '{command}'")
 
     def show_command_help(self, category: str = None):
         """Show help for commands"""
@@ -204,7 +247,7 @@ class InputHandler:
 
     def get_command_history(self, limit: int = 10) -> List[str]:
         """Get recent command history"""
-        return self.command_history[-limit:] if self.command_history else []
+        return list(self.command_history)[-limit:]
 
     def clear_history(self):
         """Clear command history"""
@@ -212,66 +255,47 @@ class InputHandler:
 
     def suggest_command(self, context: str = None) -> List[str]:
         """Suggest commands based on context"""
-        suggestions = []
-
-        if context == "combat":
-            suggestions = self.commands["combat"]
-        elif context == "trading":
-            suggestions = self.commands["trading"]
-        elif context == "movement":
-            suggestions = self.commands["movement"]
-        elif context == "exploration":
-            suggestions = self.commands["actions"] + self.commands["travel"]
-        else:
-            # General suggestions
-            suggestions = []
-            for commands in self.commands.values():
-                suggestions.extend(commands[:3])  # Top 3 from each category
-
-        return suggestions[:10]  # Limit to 10 suggestions
+        suggestions = self._ctx_suggestions.get(context, self._ctx_suggestions[None])
+        return list(suggestions)
 
     def format_command(self, command: str) -> str:
         """Format a command for display"""
-        # Add syntax highlighting for common patterns
-        formatted = command
-
-        # Highlight movement commands
-        movement_pattern = r"\b(north|south|east|west|n|s|e|w)\b"
-        formatted = re.sub(movement_pattern, r"[cyan]\1[/cyan]", formatted)
-
-        # Highlight action commands
-        action_pattern = r"\b(look|inventory|status|attack|travel|buy|sell)\b"
-        formatted = re.sub(action_pattern, r"[yellow]\1[/yellow]", formatted)
-
-        # Highlight system commands
-        system_pattern = r"\b(help|quit|save|load)\b"
-        formatted = re.sub(system_pattern, r"[red]\1[/red]", formatted)
-
-        return formatted
+        # Highlight movement, action and system commands in a single pass
+        return _HIGHLIGHT_RE.sub(_colorize, command)
 
     def get_autocomplete_options(self, partial: str) -> List[str]:
         """Get autocomplete options for partial input"""
         if not partial:
             return []
 
-        options = []
-        partial_lower = partial.lower()
-
-        # Check all commands
-        for category, commands in self.commands.items():
-            for cmd in commands:
-                if cmd.startswith(partial_lower):
-                    options.append(cmd)
-
-        # Check aliases
-        for alias in self.aliases:
-            if alias.startswith(partial_lower):
-                options.append(alias)
-
-        return sorted(list(set(options)))[:5]  # Remove duplicates and limit
+        # Commands and aliases share one sorted list, so matches are already
+        # unique and in order
+        return self._prefix_matches(self._sorted_cmds, partial.lower(), 5)
+
+    @staticmethod
+    def _prefix_matches(sorted_cmds: List[str], prefix: str, limit: Optional[int]) -> List[str]:
+        """Return up to limit (or all, if None) entries of sorted_cmds starting with prefix"""
+        matches = []
+        for i in range(bisect_left(sorted_cmds, prefix), len(sorted_cmds)):
+            cmd = sorted_cmds[i]
+            if not cmd.startswith(prefix) or len(matches) == limit:
+                break
+            matches.append(cmd)
+        return matches
 
     def process_input(self, raw_input: str) -> Dict:
         """Process raw input and return structured result"""
+        # Bare Enter is common; skip parsing and validation entirely
+        if not raw_input or raw_input.isspace():
+            return {
+                "raw_input": raw_input,
+                "action": "",
+                "args": [],
+                "valid": False,
+                "message": "",
+                "suggestions": [],
+            }
+
         action, args = self.parse_command(raw_input)
         validation = self.validate_command(action, args)
 
@@ -283,3 +307,7 @@ class InputHandler:
             "message": validation["message"],
             "suggestions": validation["suggestions"],
         }
+
+
+# Shared instance so callers reuse one Console and command history
+input_handler = InputHandler()
@@ -1,9 +1,29 @@
 from flask import Flask, request, jsonify
+from werkzeug.exceptions import BadRequest
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
+from functools import partial
+import threading
 import time
 import sys
+import uuid
 from pathlib import Path
 
+try:
+    import orjson
+
+    # Match jsonify: sorted keys, int keys (e.g. sector maps in world data)
+    # as strings, datetimes and dataclasses through Flask's default()
+    _ORJSON_OPTIONS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 BASE_DIR = Path(__file__).resolve().parents[1]
 sys.path.append(str(BASE_DIR))
 
@@ -12,14 +32,65 @@ from game.save_system import SaveGameSystem, GameState
 app = Flask(__name__)
 save_system = SaveGameSystem(save_directory=str(BASE_DIR / "saves"))
 
+# Async saves run off the request thread. SaveGameSystem rewrites one shared
+# metadata file on every save, so the pool has a single worker and every
+# write, sync or async, holds _save_lock.
+_save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+_save_lock = threading.Lock()
+
+# Finished async saves are kept this long for /save_status to collect
+PENDING_SAVE_TTL = 300  # seconds
+_pending_saves = {}  # task id -> future
+_finished_at = {}  # task id -> time.monotonic() when its save finished
+
+# save name -> ((mtime_ns, size, checksum), integrity result)
+_integrity_cache = {}
+
+
+def _write_save(game_state, save_name):
+    with _save_lock:
+        return save_system.save_game(game_state, save_name, overwrite=True)
+
+
+def _save_finished(task_id, future):
+    _finished_at[task_id] = time.monotonic()
+
+
+def _expire_pending_saves():
+    """Forget finished async saves that were not collected within the TTL"""
+    cutoff = time.monotonic() - PENDING_SAVE_TTL
+    for task_id, finished_at in list(_finished_at.items()):
+        if finished_at < cutoff:
+            _pending_saves.pop(task_id, None)
+            _finished_at.pop(task_id, None)
+
+
+def _read_json():
+    """Parse the request body as JSON, with orjson when it is installed"""
+    if not ORJSON_AVAILABLE:
+        return request.get_json(force=True)
+    try:
+        return orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        raise BadRequest("Failed to decode JSON object")
+
+
+def _json_response(payload, status=200):
+    """Serialize a response payload, with orjson when it is installed"""
+    if not ORJSON_AVAILABLE:
+        return jsonify(payload), status
+    body = orjson.dumps(payload, default=app.json.default, option=_ORJSON_OPTIONS)
+    return app.response_class(body, status=status, mimetype="application/json")
+
 
 @app.post("/save")
 def save():
-    data = request.get_json(force=True)
+    data = _read_json()
     save_name = data.get("save_name", "quicksave")
     game_data = data.get("game_data", {})
 
-    player = game_data.get("player", {}).copy()
+    # The parsed request body belongs to this request, so fill it in place
+    player = game_data.get("player") or {}
     player["inventory"] = game_data.get("inventory", [])
 
     game_state = GameState(
@@ -36,29 +107,74 @@ def save():
         timestamp=time.time(),
     )
 
-    save_id = save_system.save_game(game_state, save_name, overwrite=True)
+    _integrity_cache.pop(save_name, None)
+    if data.get("async"):
+        _expire_pending_saves()
+        task_id = uuid.uuid4().hex
+        future = _save_pool.submit(_write_save, game_state, save_name)
+        _pending_saves[task_id] = future
+        future.add_done_callback(partial(_save_finished, task_id))
+        return _json_response({"success": True, "pending": True, "task_id": task_id}, 202)
+
+    return _save_result(_write_save(game_state, save_name))
+
+
+@app.get("/save_status/<task_id>")
+def save_status(task_id):
+    future = _pending_saves.get(task_id)
+    if future is None:
+        return _json_response({"success": False, "message": "Unknown save task"}, 404)
+    if not future.done():
+        return _json_response({"success": True, "pending": True, "task_id": task_id}, 202)
+
+    del _pending_saves[task_id]
+    _finished_at.pop(task_id, None)
+    return _save_result(future.result())
+
+
+def _verify_integrity(save_name):
+    """Verify a save, reusing the last result while its file is unchanged"""
+    metadata = save_system.save_metadata.get(save_name)
+    try:
+        stat = (save_system.save_directory / f"{save_name}.sav").stat()
+    except OSError:
+        return save_system.verify_save_integrity(save_name)
+
+    key = (stat.st_mtime_ns, stat.st_size, metadata.checksum if metadata else None)
+    cached = _integrity_cache.get(save_name)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    integrity = save_system.verify_save_integrity(save_name)
+    _integrity_cache[save_name] = (key, integrity)
+    return integrity
+
+
+def _save_result(save_id):
+    """Build the response for a finished save"""
     if save_id:
         metadata = save_system.get_save_info(save_id)
-        return jsonify(
+        return _json_response(
             {"success": True, "message": "Game saved successfully", "metadata": asdict(metadata)}
         )
-    return jsonify({"success": False, "message": "Failed to save game"}), 500
+    return _json_response({"success": False, "message": "Failed to save game"}, 500)
 
 
 @app.post("/load")
 def load():
-    data = request.get_json(force=True)
+    data = _read_json()
     save_name = data.get("save_name", "quicksave")
 
-    integrity = save_system.verify_save_integrity(save_name)
+    integrity = _verify_integrity(save_name)
     if not integrity.get("valid"):
-        return jsonify({"success": False, "message": integrity.get("error", "Invalid save")})
+        return _json_response({"success": False, "message": integrity.get("error", "Invalid save")})
 
     game_state = save_system.load_game(save_name)
     if not game_state:
-        return jsonify({"success": False, "message": "Failed to load game"})
+        return _json_response({"success": False, "message": "Failed to load game"})
 
-    player_data = game_state.player_data.copy()
+    # load_game unpickles a fresh GameState, so nothing else sees this dict
+    player_data = game_state.player_data
     inventory = player_data.pop("inventory", [])
     game_data = {
         "player": player_data,
@@ -67,7 +183,9 @@ def load():
         "skills": game_state.skill_data,
         "missions": game_state.mission_data,
     }
-    return jsonify({"success": True, "message": "Game loaded successfully", "game_data": game_data})
+    return _json_response(
+        {"success": True, "message": "Game loaded successfully", "game_data": game_data}
+    )
 
 
 if __name__ == "__main__":
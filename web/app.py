@@ -7,13 +7,17 @@ A complete web interface for the space trading game with SQLite database
 import os
 import sys
 import json
+import threading
+import random
 import time
-from copy import deepcopy
 from datetime import datetime, timedelta
-from flask import Flask, session, request, jsonify, render_template, send_from_directory, g
+from flask import Flask, Response, session, request, jsonify, render_template, send_from_directory, g
+from flask.json.provider import DefaultJSONProvider
+from flask.sessions import SecureCookieSessionInterface
 from werkzeug.security import generate_password_hash
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import text
+from sqlalchemy import insert, text, update
+from sqlalchemy.orm import load_only
 
 # Add the parent directory to the path to import game modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -65,19 +69,83 @@ except ImportError as e:
     print("Running in basic mode without full game integration")
     GAME_MODULES_AVAILABLE = False
 
+
+# The session only ever holds the session id and CSRF token strings, so Flask's
+# tagged serializer (which inspects every value for tuples, bytes, datetimes and
+# the like) has nothing to do; plain compact JSON is enough.
+class _CompactJSONSerializer:
+    """Compact JSON serializer for session cookies"""
+
+    @staticmethod
+    def dumps(value) -> str:
+        return json.dumps(value, separators=(",", ":"))
+
+    @staticmethod
+    def loads(value):
+        return json.loads(value)
+
+
+class JSONSecureCookieSessionInterface(SecureCookieSessionInterface):
+    """Signed cookie sessions serialized as untagged JSON"""
+
+    serializer = _CompactJSONSerializer()
+
+
 app = Flask(__name__)
 app.secret_key = os.environ.get("SECRET_KEY", "dev-secret-change-in-production")
+app.session_interface = JSONSecureCookieSessionInterface()
+
+# Encode API responses with orjson when it is installed
+try:
+    import orjson
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """JSON provider backed by orjson, keeping Flask's output conventions"""
+
+        # Sorted keys as Flask does; int keys (e.g. galaxy sector ids) become
+        # strings; datetimes and dataclasses go through Flask's own default(),
+        # so dates keep its HTTP format and dataclass fields are sorted too
+        _options = (
+            orjson.OPT_SORT_KEYS
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+
+        def dumps(self, obj, **kwargs) -> str:
+            options = self._options
+            if kwargs.get("indent"):
+                options |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=self.default, option=options).decode()
 
-# Database configuration - use data/db folder
-data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "db")
-os.makedirs(data_dir, exist_ok=True)
-database_path = os.path.join(data_dir, "stellarodyssey2080.db")
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json_provider_class = OrjsonProvider
+    app.json = OrjsonProvider(app)
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Database configuration - use data/db folder unless LOGDTW_DATA_DIR is set
+from web.config import DATA_DIR, DB_POOL_SIZE, DB_MAX_OVERFLOW
+
+os.makedirs(DATA_DIR, exist_ok=True)
+database_path = os.path.join(DATA_DIR, "stellarodyssey2080.db")
 app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{database_path}"
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+app.config["SQLALCHEMY_RECORD_QUERIES"] = False
+# A local SQLite file can't drop a pooled connection, so there is nothing for
+# a pre-ping to catch; SQLAlchemy's compiled statement cache is on by default
+# Sized for a threaded server: one connection per gunicorn thread. The pool
+# limits come from web/config.py, which web/gunicorn.conf.py also reads
 app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
     "pool_timeout": 20,
     "pool_recycle": -1,
-    "pool_pre_ping": True,
+    "pool_pre_ping": False,
+    "echo": False,
 }
 
 # Import models after app configuration
@@ -114,6 +182,8 @@ except ImportError:
     CACHING_AVAILABLE = False
     print("Warning: Flask-Caching not available, using simple cache")
 
+from web.cache import SectorCache, cached_prices
+
 # Import performance monitoring
 try:
     from web.performance_monitor import monitor_performance, get_performance_stats, performance_monitor
@@ -159,50 +229,143 @@ except ImportError:
 # Initialize database with local fallback support
 init_database(app, enable_local_fallback=True)
 
+# Per-request cProfile dumps when LOGDTW_PROFILE is set (view with snakeviz or tuna)
+if os.environ.get("LOGDTW_PROFILE"):
+    from werkzeug.middleware.profiler import ProfilerMiddleware
+
+    profile_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "profiler_results")
+    os.makedirs(profile_dir, exist_ok=True)
+    app.wsgi_app = ProfilerMiddleware(
+        app.wsgi_app, profile_dir=profile_dir, sort_by=("cumtime", "calls"), restrictions=[30]
+    )
+
 # Add security headers to all responses
 if SECURITY_AVAILABLE:
     @app.after_request
     def security_headers(response):
         return add_security_headers(response)
 
-# Global game systems (initialized on first use)
-game_systems = {
-    "procedural_generator": None,
-    "save_system": None,
-    "dynamic_markets": None,
-    "mission_manager": None,
-    "skill_tree": None,
-    "enhanced_combat": None,
+def _build_empire_system():
+    """Empire system for web API, if its module is usable"""
+    try:
+        from game.empire import EmpireSystem
+
+        return EmpireSystem()
+    except Exception:
+        return None
+
+
+# How to build each game system; optional ones resolve to None when their
+# class isn't available
+_SYSTEM_FACTORIES = {
+    "procedural_generator": lambda: ProceduralGenerator(),
+    # Sector generation is seeded by sector id, so results can be reused
+    "sector_cache": lambda: SectorCache(get_system("procedural_generator"), maxsize=256),
+    "save_system": lambda: SaveGameSystem("web_saves"),
+    "dynamic_markets": lambda: DynamicMarketSystem(),
+    "mission_manager": lambda: MissionManager(),
+    "skill_tree": lambda: SkillTree(),
+    "enhanced_combat": lambda: EnhancedCombatSystem(),
+    "empire": _build_empire_system,
+    "stock_market": lambda: StockMarket(),
+    "counselor": lambda: AICounselor() if "AICounselor" in globals() else None,
+    "npc_manager": lambda: NPCManager() if "NPCManager" in globals() else None,
+    "crew_manager": lambda: CrewManager() if "CrewManager" in globals() else None,
+    "diplomacy": lambda: DiplomacySystem() if "DiplomacySystem" in globals() else None,
 }
 
+# Game systems built so far, by name
+game_systems = {}
+_game_systems_lock = threading.RLock()
 
-def get_game_systems():
-    """Initialize game systems on first use"""
+
+def get_system(name: str):
+    """Get a shared game system, building it on first use"""
+    try:
+        return game_systems[name]
+    except KeyError:
+        pass
     if not GAME_MODULES_AVAILABLE:
-        return {}
-
-    if game_systems["procedural_generator"] is None:
-        game_systems["procedural_generator"] = ProceduralGenerator()
-        game_systems["save_system"] = SaveGameSystem("web_saves")
-        game_systems["dynamic_markets"] = DynamicMarketSystem()
-        game_systems["mission_manager"] = MissionManager()
-        game_systems["skill_tree"] = SkillTree()
-        game_systems["enhanced_combat"] = EnhancedCombatSystem()
-        # Empire system for web API
-        try:
-            from game.empire import EmpireSystem
+        return None
+    with _game_systems_lock:
+        if name not in game_systems:
+            game_systems[name] = _SYSTEM_FACTORIES[name]()
+        return game_systems[name]
+
+
+def warm_game_systems():
+    """Build every game system now, e.g. in a preloading server's master process"""
+    for name in _SYSTEM_FACTORIES:
+        get_system(name)
+
+
+# Shared RNG for scans, chatter and status events
+_rng = random.Random()
+_ENEMY_TYPES = ("space_pirate", "alien_scout", "rogue_trader")
+
+# Static trade prices when the game modules are unavailable
+FALLBACK_PRICES = {
+    "Food": 50,
+    "Iron": 100,
+    "Electronics": 300,
+    "Weapons": 800,
+    "Medicine": 400,
+    "Fuel": 75,
+    "Tritium": 5000,
+    "Dilithium": 8000,
+    "Ammolite": 12000,
+}
 
-            game_systems["empire"] = EmpireSystem()
-        except Exception:
-            game_systems["empire"] = None
-        # Additional systems
-        game_systems["stock_market"] = StockMarket()
-        game_systems["counselor"] = AICounselor()
-        game_systems["npc_manager"] = NPCManager() if "NPCManager" in globals() else None
-        game_systems["crew_manager"] = CrewManager() if "CrewManager" in globals() else None
-        game_systems["diplomacy"] = DiplomacySystem() if "DiplomacySystem" in globals() else None
+# The static market lists only the common goods; the rare ones stay tradable
+FALLBACK_MARKET_PRICES = {
+    item: FALLBACK_PRICES[item]
+    for item in ("Food", "Iron", "Electronics", "Weapons", "Medicine", "Fuel")
+}
 
-    return game_systems
+# Sector markets are shared by all players and redrawn once per tick
+MARKET_TICK_SECONDS = 30
+
+
+def market_tick() -> int:
+    """Current tick of the shared market clock"""
+    return int(time.time() // MARKET_TICK_SECONDS)
+
+
+def cached_json_response(cache_key: str):
+    """Return a response built from cached JSON bytes, or None on a miss"""
+    body = cache.get(cache_key)
+    if body is None:
+        return None
+    return app.response_class(body, mimetype="application/json")
+
+
+def cache_json_response(cache_key: str, payload: dict, ttl: int):
+    """Encode a payload once and return the response
+
+    The bytes are cached by commit_request_session once the request's writes
+    are committed, so a failed commit never leaves a success body cached.
+    """
+    response = jsonify(payload)
+    g.setdefault("cache_writes", []).append((cache_key, response.get_data(), ttl))
+    return response
+
+
+def invalidate_cached_response(cache_key: str):
+    """Drop a cached response once the request's writes are committed"""
+    g.setdefault("cache_writes", []).append((cache_key, None, None))
+
+
+def _apply_cache_writes(writes):
+    for cache_key, body, ttl in writes:
+        try:
+            if body is None:
+                cache.delete(cache_key)
+            elif CACHING_AVAILABLE:
+                cache.set(cache_key, body, timeout=ttl)
+            else:
+                cache.set(cache_key, body, ttl=ttl)
+        except Exception as cache_error:
+            app.logger.warning(f"Cache update failed: {str(cache_error)}")
 
 
 def get_session_id() -> str:
@@ -220,10 +383,28 @@ def get_session_id() -> str:
     return session["session_id"]
 
 
+# One game Player per worker thread, rebound to the web player on each use
+_thread_state = threading.local()
+
+
+def conversation_player(player: Player) -> "GamePlayer":
+    """Get this thread's game Player carrying the web player's name, credits and reputation"""
+    game_player = getattr(_thread_state, "game_player", None)
+    if game_player is None:
+        game_player = GamePlayer()
+        _thread_state.game_player = game_player
+    game_player.__dict__.update(
+        name=player.name, credits=player.credits, reputation=player.reputation
+    )
+    return game_player
+
+
 def get_current_player() -> Player:
-    """Get the current player from database"""
-    session_id = get_session_id()
-    return get_or_create_player(session_id)
+    """Get the current player from database, loading it at most once per request"""
+    player = g.get("player")
+    if player is None:
+        player = g.player = get_or_create_player(get_session_id())
+    return player
 
 
 @app.route("/api/auth/register", methods=["POST"])
@@ -239,11 +420,10 @@ def auth_register():
     user = User(username=username, email=email)
     user.set_password(password)
     db.session.add(user)
-    db.session.commit()
+    db.session.flush()
     # Link current session player to this user
     player = get_current_player()
     player.user_id = user.id
-    db.session.commit()
     return jsonify(success=True, user_id=user.id)
 
 
@@ -256,11 +436,9 @@ def auth_login():
     if not user or not user.check_password(password):
         return jsonify(success=False, message="Invalid credentials"), 401
     user.last_login = datetime.utcnow()
-    db.session.commit()
     # Attach current session player to the user (merge progress)
     player = get_current_player()
     player.user_id = user.id
-    db.session.commit()
     return jsonify(success=True, user_id=user.id)
 
 
@@ -270,6 +448,24 @@ def auth_logout():
     return jsonify(success=True)
 
 
+def discovered_sector_ids(player_id: int) -> list:
+    """Sector ids the player has discovered, read as plain ints rather than full rows"""
+    rows = db.session.query(SectorVisibility.sector_id).filter_by(
+        player_id=player_id, discovered=True
+    )
+    return [sector_id for (sector_id,) in rows]
+
+
+# Columns InventoryItem.to_dict() reads
+INVENTORY_DICT_COLUMNS = (
+    InventoryItem.name,
+    InventoryItem.item_type,
+    InventoryItem.quantity,
+    InventoryItem.value,
+    InventoryItem.properties_json,
+)
+
+
 def get_game_data() -> dict:
     """Get current game data formatted for legacy API compatibility"""
     player = get_current_player()
@@ -287,27 +483,30 @@ def get_game_data() -> dict:
         if cached_data is not None:
             return cached_data
 
-    # Use eager loading to avoid N+1 queries
-    from sqlalchemy.orm import joinedload
-    
-    # Get inventory items with single query
-    inventory_items = [item.to_dict() for item in player.inventory]
-
-    # Get discovered sectors with single query
-    discovered_sectors = [
-        v.sector_id
-        for v in SectorVisibility.query.filter_by(player_id=player.id, discovered=True).all()
-    ]
-
-    # Get active missions with single query
-    active_missions = [
-        mission.to_dict()
-        for mission in PlayerMission.query.filter_by(player_id=player.id, status="active").all()
-    ]
-
-    # Format data for legacy compatibility
+    # These reads change nothing, so don't flush pending writes before each one
+    with db.session.no_autoflush:
+        # Get inventory items with single query, loading only the columns to_dict() reads
+        inventory_items = [
+            item.to_dict()
+            for item in InventoryItem.query.options(load_only(*INVENTORY_DICT_COLUMNS)).filter_by(
+                player_id=player.id
+            )
+        ]
+
+        # Get discovered sectors with single query
+        discovered_sectors = discovered_sector_ids(player.id)
+
+        # Get active missions with single query
+        active_missions = [
+            mission.to_dict()
+            for mission in PlayerMission.query.filter_by(player_id=player.id, status="active")
+        ]
+
+    # Format data for legacy compatibility; skills and reputation are JSON
+    # columns, so reuse the dicts to_dict() already decoded
+    player_data = player.to_dict()
     result = {
-        "player": player.to_dict(),
+        "player": player_data,
         "world": {
             "current_location": player.current_location,
             "discovered_sectors": discovered_sectors,
@@ -315,8 +514,8 @@ def get_game_data() -> dict:
         },
         "inventory": inventory_items,
         "missions": active_missions,
-        "skills": player.skills,
-        "reputation": player.reputation,
+        "skills": player_data["skills"],
+        "reputation": player_data["reputation"],
     }
     
     # Cache for 30 seconds (short TTL since game state changes frequently)
@@ -339,55 +538,70 @@ def update_fog_of_war(player: Player, new_sector: int = None):
     # Get or create fog of war system
     fog_system = FogOfWarSystem(max_sectors=GameSettings.get_setting("max_sectors", 1000))
 
-    # Load existing visibility data (single query with index)
-    visibility_records = SectorVisibility.query.filter_by(player_id=player.id).all()
-    for record in visibility_records:
-        fog_system.sector_visibility[record.sector_id].discovered = record.discovered
-        fog_system.sector_visibility[record.sector_id].visible = record.visible
-        fog_system.sector_visibility[record.sector_id].visit_count = record.visit_count
+    # Load existing visibility data (single query with index). Only sectors
+    # within sensor range of the current one can change, so only their rows
+    # are read, as plain column tuples rather than ORM objects
+    rows = db.session.query(
+        SectorVisibility.sector_id,
+        SectorVisibility.discovered,
+        SectorVisibility.visible,
+        SectorVisibility.visit_count,
+    ).filter(
+        SectorVisibility.player_id == player.id,
+        SectorVisibility.sector_id.between(
+            current_sector - sensor_range, current_sector + sensor_range
+        ),
+    )
+    existing_sectors = set()
+    for sector_id, discovered, visible, visit_count in rows:
+        existing_sectors.add(sector_id)
+        visibility = fog_system.get_sector_visibility(sector_id)
+        visibility.discovered = discovered
+        visibility.visible = visible
+        visibility.visit_count = visit_count
 
     # Update visibility
     newly_visible = fog_system.update_visibility(current_sector, sensor_range)
 
-    # Batch database operations for better performance
+    # Batch database operations for better performance: one UPDATE for
+    # revisited sectors and one multi-row INSERT for new ones
     if newly_visible:
-        # Get all existing records in one query
-        existing_sectors = {
-            v.sector_id: v
-            for v in SectorVisibility.query.filter(
-                SectorVisibility.player_id == player.id,
-                SectorVisibility.sector_id.in_(newly_visible)
-            ).all()
-        }
-        
         now = datetime.utcnow()
-        records_to_add = []
-        
-        for sector_id in newly_visible:
-            if sector_id in existing_sectors:
-                # Update existing record
-                vis_record = existing_sectors[sector_id]
-                vis_record.discovered = True
-                vis_record.visible = True
-                vis_record.visit_count += 1
-                vis_record.last_visited = now
-            else:
-                # Create new record
-                vis_record = SectorVisibility(
-                    player_id=player.id,
-                    sector_id=sector_id,
+        # Existing records were loaded above, so membership is a set lookup
+        revisited = [sector_id for sector_id in newly_visible if sector_id in existing_sectors]
+        new_rows = [
+            {
+                "player_id": player.id,
+                "sector_id": sector_id,
+                "discovered": True,
+                "visible": True,
+                "visit_count": 1,
+                "last_visited": now,
+            }
+            for sector_id in newly_visible
+            if sector_id not in existing_sectors
+        ]
+
+        if revisited:
+            db.session.execute(
+                update(SectorVisibility)
+                .where(
+                    SectorVisibility.player_id == player.id,
+                    SectorVisibility.sector_id.in_(revisited),
+                )
+                .values(
                     discovered=True,
                     visible=True,
-                    visit_count=1,
+                    visit_count=SectorVisibility.visit_count + 1,
                     last_visited=now,
-                )
-                records_to_add.append(vis_record)
-        
-        # Bulk add new records
-        if records_to_add:
-            db.session.bulk_save_objects(records_to_add)
-        
-        db.session.commit()
+                ),
+                execution_options={"synchronize_session": False},
+            )
+        if new_rows:
+            db.session.execute(insert(SectorVisibility), new_rows)
+
+        # Committed with the rest of the request in commit_request_session
+        db.session.flush()
         
         # Invalidate cache for this player's game data
         cache_key = f"game_data:{player.id}:{player.turn_counter}"
@@ -411,7 +625,8 @@ def check_random_events(player: Player, context: "EventContext") -> dict:
         "current_sector": player.current_sector,
         "credits": player.credits,
         "reputation": player.reputation,
-        "inventory": [item.to_dict() for item in player.inventory],
+        # Event requirements only look at item names
+        "inventory": [{"name": item.name} for item in player.inventory],
         "sector_danger": min(5, max(1, player.current_sector // 20 + 1)),
     }
 
@@ -419,8 +634,10 @@ def check_random_events(player: Player, context: "EventContext") -> dict:
     triggered_event = event_system.check_for_events(context, game_state)
 
     if triggered_event:
-        # Handle the event
+        # Handle the event. The outcome's fields are shared by the history
+        # record and the response; neither changes them, so no copy is made
         outcome = event_system.handle_event(triggered_event, game_state)
+        outcome_data = outcome.__dict__
 
         # Save event to database
         event_record = EventHistory(
@@ -431,40 +648,36 @@ def check_random_events(player: Player, context: "EventContext") -> dict:
             sector_id=player.current_sector,
             turn_number=player.turn_counter,
             event_data={"triggered_event": triggered_event.name},
-            outcome=outcome.__dict__,
+            outcome=outcome_data,
         )
         db.session.add(event_record)
 
-        # Apply effects to player
-        if outcome.effects:
-            if "health_damage" in outcome.effects:
-                player.health = max(0, player.health - outcome.effects["health_damage"])
-            if "fuel_loss" in outcome.effects:
-                player.fuel = max(0, player.fuel - outcome.effects["fuel_loss"])
-            if "credit_cost" in outcome.effects:
-                player.credits = max(0, player.credits - outcome.effects["credit_cost"])
-
-        if outcome.rewards:
-            if "credits" in outcome.rewards:
-                player.credits += outcome.rewards["credits"]
-            if "experience" in outcome.rewards:
-                player.add_experience(outcome.rewards["experience"])
-
-        if outcome.penalties:
-            if "health" in outcome.penalties:
-                player.health = max(0, player.health - outcome.penalties["health"])
-            if "credits" in outcome.penalties:
-                player.credits = max(0, player.credits - outcome.penalties["credits"])
-            if "fuel" in outcome.penalties:
-                player.fuel = max(0, player.fuel - outcome.penalties["fuel"])
+        # Apply effects to player; missing keys count as zero
+        effects = outcome.effects
+        if effects:
+            player.health = max(0, player.health - effects.get("health_damage", 0))
+            player.fuel = max(0, player.fuel - effects.get("fuel_loss", 0))
+            player.credits = max(0, player.credits - effects.get("credit_cost", 0))
 
-        db.session.commit()
+        rewards = outcome.rewards
+        if rewards:
+            player.credits += rewards.get("credits", 0)
+            if "experience" in rewards:
+                player.add_experience(rewards["experience"])
+
+        penalties = outcome.penalties
+        if penalties:
+            player.health = max(0, player.health - penalties.get("health", 0))
+            player.credits = max(0, player.credits - penalties.get("credits", 0))
+            player.fuel = max(0, player.fuel - penalties.get("fuel", 0))
+
+        db.session.flush()
 
         return {
             "event_triggered": True,
             "event_name": triggered_event.name,
             "event_description": triggered_event.description,
-            "outcome": outcome.__dict__,
+            "outcome": outcome_data,
         }
 
     return None
@@ -482,21 +695,35 @@ def game():
     return render_template("index.html")
 
 
+def stocks_cache_key(market) -> str:
+    """Cache key of the stock listing for the market's current prices"""
+    return f"stocks:{market.last_update}"
+
+
 # ============================================================================
 # API Routes
 @app.route("/api/stocks", methods=["GET", "POST"])
 def api_stocks():
     if not GAME_MODULES_AVAILABLE:
         return jsonify(success=False, message="Stock market not available"), 501
-    systems = get_game_systems()
-    market = systems.get("stock_market")
+    market = get_system("stock_market")
     player = get_current_player()
     if request.method == "GET":
-        # Update prices if needed
+        # Update prices if needed; they only move every few minutes, so the
+        # encoded listing is reused until then or until a trade
         market.update_market()
-        stocks = [s.__dict__ for s in market.get_all_stocks()]
-        portfolio = market.get_portfolio_summary()
-        return jsonify(success=True, stocks=stocks, portfolio=portfolio)
+        cache_key = stocks_cache_key(market)
+        cached_response = cached_json_response(cache_key)
+        if cached_response is not None:
+            return cached_response
+
+        # Stock is a dataclass, which the JSON provider serializes directly
+        result = {
+            "success": True,
+            "stocks": market.get_all_stocks(),
+            "portfolio": market.get_portfolio_summary(),
+        }
+        return cache_json_response(cache_key, result, ttl=5)
     else:
         data = request.get_json() or {}
         action = str(data.get("action", "")).lower()
@@ -508,7 +735,8 @@ def api_stocks():
             res = market.sell_stock(player, symbol, shares)
         else:
             return jsonify(success=False, message="Invalid action"), 400
-        db.session.commit()
+        db.session.flush()
+        invalidate_cached_response(stocks_cache_key(market))
         return jsonify(res)
 
 
@@ -516,9 +744,14 @@ def api_stocks():
 def api_counselor_tip():
     if not GAME_MODULES_AVAILABLE:
         return jsonify(success=False, message="Counselor not available"), 501
-    systems = get_game_systems()
-    counselor = systems.get("counselor")
+    counselor = get_system("counselor")
     player = get_current_player()
+
+    cache_key = f"counselor:{player.id}:{player.turn_counter}"
+    cached_response = cached_json_response(cache_key)
+    if cached_response is not None:
+        return cached_response
+
     tip = (
         counselor.get_tip(
             {
@@ -530,7 +763,7 @@ def api_counselor_tip():
         if counselor
         else "Counselor unavailable"
     )
-    return jsonify(success=True, tip=tip)
+    return cache_json_response(cache_key, {"success": True, "tip": tip}, ttl=60)
 
 
 @app.route("/api/npc/list", methods=["GET"])
@@ -539,14 +772,20 @@ def api_npc_list():
     if not GAME_MODULES_AVAILABLE:
         return jsonify(success=False, message="NPC system not available"), 501
     
-    systems = get_game_systems()
-    npc_manager = systems.get("npc_manager")
+    npc_manager = get_system("npc_manager")
     if not npc_manager:
         return jsonify(success=False, message="NPC system not initialized"), 501
     
     player = get_current_player()
     player_location = player.current_location or f"Sector {player.current_sector}"
-    
+
+    # NPCs come from the shared NPC manager and carry no per-player state,
+    # so the listing depends only on where the player is
+    cache_key = f"npcs:{player_location}"
+    cached_response = cached_json_response(cache_key)
+    if cached_response is not None:
+        return cached_response
+
     try:
         # Try to get NPCs at current location
         npcs_list = []
@@ -604,7 +843,7 @@ def api_npc_list():
                 },
             ]
         
-        return jsonify(success=True, npcs=npcs_list)
+        return cache_json_response(cache_key, {"success": True, "npcs": npcs_list}, ttl=60)
     
     except Exception as e:
         app.logger.error(f"Error getting NPC list: {str(e)}", exc_info=True)
@@ -636,8 +875,7 @@ def api_npc_talk():
     if not GAME_MODULES_AVAILABLE:
         return jsonify(success=False, message="NPC system not available"), 501
     
-    systems = get_game_systems()
-    npc_manager = systems.get("npc_manager")
+    npc_manager = get_system("npc_manager")
     if not npc_manager:
         return jsonify(success=False, message="NPC system not initialized"), 501
     
@@ -661,9 +899,8 @@ def api_npc_talk():
             npcs_at_location = npc_manager.get_npcs_at_location(player_location)
             npc = next((n for n in npcs_at_location if n.name == target_name), None)
         
-        # Create GamePlayer for conversation system
-        game_player = GamePlayer(name=player.name, credits=player.credits)
-        game_player.reputation = player.reputation
+        # Game-side player for the conversation system
+        game_player = conversation_player(player)
         
         # Handle initial greeting
         if message.lower() in ["greeting", "hello", "hi", ""] or not message:
@@ -681,8 +918,7 @@ def api_npc_talk():
                     f"{target_name} responding. What's on your mind?",
                     f"Channel open. This is {target_name}.",
                 ]
-                import random
-                reply = random.choice(greetings)
+                reply = _rng.choice(greetings)
         else:
             # Handle conversation choice
             if npc and hasattr(npc_manager, "handle_conversation_choice"):
@@ -693,7 +929,6 @@ def api_npc_talk():
                 reply = npc_manager.talk(target_name)
             else:
                 # Generic response based on message content
-                import random
                 if any(word in message.lower() for word in ["help", "assist", "need"]):
                     responses = [
                         f"{target_name}: I can help with that. What specifically do you need?",
@@ -713,7 +948,7 @@ def api_npc_talk():
                         f"{target_name}: Understood. Anything else?",
                         f"{target_name}: Acknowledged.",
                     ]
-                reply = random.choice(responses)
+                reply = _rng.choice(responses)
         
         return jsonify(success=True, reply=reply)
     
@@ -730,20 +965,54 @@ def api_npc_talk():
 def api_crew():
     if not GAME_MODULES_AVAILABLE:
         return jsonify(success=False, message="Crew system not available"), 501
-    systems = get_game_systems()
-    crew_manager = systems.get("crew_manager")
+    # The crew roster belongs to the shared crew manager, not to a player,
+    # so every player gets the same listing
+    cached_response = cached_json_response("crew")
+    if cached_response is not None:
+        return cached_response
+    crew_manager = get_system("crew_manager")
     crew = crew_manager.list_crew() if crew_manager and hasattr(crew_manager, "list_crew") else []
-    return jsonify(success=True, crew=crew)
+    return cache_json_response("crew", {"success": True, "crew": crew}, ttl=60)
 
 
 @app.route("/api/diplomacy", methods=["GET"])
 def api_diplomacy():
     if not GAME_MODULES_AVAILABLE:
         return jsonify(success=False, message="Diplomacy not available"), 501
-    systems = get_game_systems()
-    diplomacy = systems.get("diplomacy")
+    # Faction relations are galaxy-wide state of the shared diplomacy system
+    cached_response = cached_json_response("diplomacy")
+    if cached_response is not None:
+        return cached_response
+    diplomacy = get_system("diplomacy")
     status = diplomacy.get_status() if diplomacy and hasattr(diplomacy, "get_status") else {}
-    return jsonify(success=True, diplomacy=status)
+    return cache_json_response("diplomacy", {"success": True, "diplomacy": status}, ttl=60)
+
+
+SESSION_MAX_IDLE_HOURS = 24
+SESSION_CLEANUP_INTERVAL = 3600  # seconds
+_session_cleanup_thread = None
+
+
+def _session_cleanup_loop(interval: int):
+    while True:
+        time.sleep(interval)
+        with app.app_context():
+            try:
+                cleanup_old_sessions(hours=SESSION_MAX_IDLE_HOURS)
+            except Exception as cleanup_error:
+                db.session.rollback()
+                app.logger.warning(f"Session cleanup failed: {str(cleanup_error)}")
+
+
+def start_session_cleanup(interval: int = SESSION_CLEANUP_INTERVAL):
+    """Purge idle player sessions from a background thread instead of on request"""
+    global _session_cleanup_thread
+    if _session_cleanup_thread is None or not _session_cleanup_thread.is_alive():
+        _session_cleanup_thread = threading.Thread(
+            target=_session_cleanup_loop, args=(interval,), name="session-cleanup", daemon=True
+        )
+        _session_cleanup_thread.start()
+    return _session_cleanup_thread
 
 
 @app.route("/api/session", methods=["POST"])
@@ -751,11 +1020,6 @@ def api_diplomacy():
 def create_session():
     """Establish a session for the web client and return a token."""
     sid = get_session_id()
-    try:
-        cleanup_old_sessions(hours=24)
-    except Exception:
-        pass
-    
     response_data = {"success": True, "token": sid}
     
     # Include CSRF token in response if security is available
@@ -772,8 +1036,7 @@ def create_session():
 def api_empire_capture():
     if not GAME_MODULES_AVAILABLE:
         return jsonify(success=False, message="Empire system not available"), 501
-    systems = get_game_systems()
-    empire = systems.get("empire")
+    empire = get_system("empire")
     if not empire:
         return jsonify(success=False, message="Empire system not initialized"), 500
     # For web, capture where player is currently located
@@ -806,8 +1069,7 @@ def api_empire_capture():
 def api_empire_policy():
     if not GAME_MODULES_AVAILABLE:
         return jsonify(success=False, message="Empire system not available"), 501
-    systems = get_game_systems()
-    empire = systems.get("empire")
+    empire = get_system("empire")
     data = request.get_json() or {}
     player = get_current_player()
     planet = data.get("planet") or (player.current_location or "")
@@ -827,8 +1089,7 @@ def api_empire_policy():
 def api_empire_raise():
     if not GAME_MODULES_AVAILABLE:
         return jsonify(success=False, message="Empire system not available"), 501
-    systems = get_game_systems()
-    empire = systems.get("empire")
+    empire = get_system("empire")
     data = request.get_json() or {}
     amount = int(data.get("amount", 0))
     player = get_current_player()
@@ -841,8 +1102,7 @@ def api_empire_raise():
 def api_empire_status():
     if not GAME_MODULES_AVAILABLE:
         return jsonify(success=False, message="Empire system not available"), 501
-    systems = get_game_systems()
-    empire = systems.get("empire")
+    empire = get_system("empire")
     return jsonify(success=True, empire=empire.status() if empire else [])
 
 
@@ -868,14 +1128,9 @@ def get_status():
         # Cache status for 5 seconds (frequently called endpoint)
         cache_key = f"status:{player.id}:{player.turn_counter}"
         
-        if CACHING_AVAILABLE:
-            cached_status = cache.get(cache_key)
-            if cached_status is not None:
-                return jsonify(cached_status)
-        else:
-            cached_status = cache.get(cache_key)
-            if cached_status is not None:
-                return jsonify(cached_status)
+        cached_response = cached_json_response(cache_key)
+        if cached_response is not None:
+            return cached_response
 
         # Update fog of war (only if not cached) - wrap in try/except to prevent failures
         try:
@@ -888,8 +1143,7 @@ def get_status():
         event_result = None
         if GAME_MODULES_AVAILABLE:
             try:
-                import random
-                if random.random() < 0.01:  # 1% chance per status check
+                if _rng.random() < 0.01:  # 1% chance per status check
                     event_result = check_random_events(player, EventContext.IN_SPACE)
             except Exception as event_error:
                 app.logger.warning(f"Random event check failed: {str(event_error)}")
@@ -904,10 +1158,7 @@ def get_status():
 
         # Get discovered sectors for fog of war (single query with index)
         try:
-            discovered_sectors = [
-                v.sector_id
-                for v in SectorVisibility.query.filter_by(player_id=player.id, discovered=True).all()
-            ]
+            discovered_sectors = discovered_sector_ids(player.id)
         except Exception as sector_error:
             app.logger.warning(f"Discovered sectors loading failed: {str(sector_error)}")
             discovered_sectors = []
@@ -928,17 +1179,8 @@ def get_status():
         if event_result:
             response["random_event"] = event_result
 
-        # Cache for 5 seconds
-        try:
-            if CACHING_AVAILABLE:
-                cache.set(cache_key, response, timeout=5)
-            else:
-                cache.set(cache_key, response, ttl=5)
-        except Exception as cache_error:
-            app.logger.warning(f"Cache set failed: {str(cache_error)}")
-            # Continue without caching
-
-        return jsonify(response)
+        # Cache the encoded response for 5 seconds
+        return cache_json_response(cache_key, response, ttl=5)
 
     except Exception as e:
         app.logger.error(f"Error in /api/status: {str(e)}", exc_info=True)
@@ -955,19 +1197,24 @@ def get_status():
 @require_csrf
 def travel():
     """Travel to a new sector"""
-    player = get_current_player()
-    json_data = request.get_json() or {}
-    sector = int(json_data.get("sector", 0))
+    # Validate the request before loading the player
+    json_data = request.get_json(silent=True) or {}
+    try:
+        sector = int(json_data.get("sector", 0))
+    except (TypeError, ValueError):
+        return jsonify(success=False, message="Invalid sector")
 
     if not (1 <= sector <= 1000):  # Expanded range for procedural sectors
         return jsonify(success=False, message="Invalid sector")
 
-    if player.fuel < 10:
+    player = get_current_player()
+    fuel = player.fuel
+    if fuel < 10:
         return jsonify(success=False, message="Insufficient fuel")
 
     # Update player location
     player.current_sector = sector
-    player.fuel -= 10
+    player.fuel = fuel - 10
     player.turn_counter += 1
 
     # Update fog of war (this handles adding discovered sectors)
@@ -979,9 +1226,8 @@ def travel():
     # Generate sector info if game modules available
     sector_info = {}
     if GAME_MODULES_AVAILABLE:
-        systems = get_game_systems()
-        proc_gen = systems["procedural_generator"]
-        sector_data = proc_gen.generate_galaxy_sector(sector)
+        generate_sector = get_system("sector_cache")
+        sector_data = generate_sector(sector)
         sector_info = {
             "name": sector_data.name,
             "faction": sector_data.faction_control,
@@ -990,8 +1236,8 @@ def travel():
             "stations": len(sector_data.stations),
         }
 
-    # Save changes to database
-    db.session.commit()
+    # Write changes now so errors surface here; commit_request_session commits
+    db.session.flush()
 
     response = {
         "success": True,
@@ -1012,96 +1258,95 @@ def travel():
 @require_csrf
 def trade():
     """Execute a trade transaction"""
-    player = get_current_player()
-    json_data = request.get_json() or {}
+    # Validate the request before loading the player
+    json_data = request.get_json(silent=True) or {}
     item = json_data.get("item")
-    quantity = int(json_data.get("quantity", 0))
     action = json_data.get("trade_action")
+    if action not in ("buy", "sell"):
+        return jsonify(success=False, message="Invalid trade action")
+
+    try:
+        quantity = int(json_data.get("quantity", 0))
+    except (TypeError, ValueError):
+        return jsonify(success=False, message="Invalid quantity")
+    if quantity < 1:
+        return jsonify(success=False, message="Invalid quantity")
+
+    player = get_current_player()
 
     # Get dynamic prices if available
     if GAME_MODULES_AVAILABLE:
-        systems = get_game_systems()
-        markets = systems["dynamic_markets"]
+        markets = get_system("dynamic_markets")
         current_sector = player.current_sector
 
         # Initialize sector economy if needed
         if current_sector not in markets.sector_economies:
             markets.initialize_sector_economy(current_sector)
 
-        market_prices = markets.get_sector_prices(current_sector)
+        market_prices = cached_prices(markets, current_sector, market_tick())
     else:
-        # Fallback static prices
-        market_prices = {
-            "Food": 50,
-            "Iron": 100,
-            "Electronics": 300,
-            "Weapons": 800,
-            "Medicine": 400,
-            "Fuel": 75,
-            "Tritium": 5000,
-            "Dilithium": 8000,
-            "Ammolite": 12000,
-        }
+        market_prices = FALLBACK_PRICES
 
-    if item not in market_prices:
+    unit_price = market_prices.get(item)
+    if unit_price is None:
         return jsonify(success=False, message="Invalid item")
 
-    price = market_prices[item] * quantity
+    price = unit_price * quantity
+    credits = player.credits
+
+    # Load the inventory once, keyed by name; it serves both the item lookup
+    # and the response, so neither needs its own query
+    inventory = {inv.name: inv for inv in player.inventory}
+    inventory_item = inventory.get(item)
 
     if action == "buy":
-        if player.credits >= price:
-            player.credits -= price
+        if credits >= price:
+            player.credits = credits - price
 
             # Add to inventory
-            inventory_item = InventoryItem.query.filter_by(player_id=player.id, name=item).first()
-
             if inventory_item:
                 inventory_item.quantity += quantity
             else:
                 inventory_item = InventoryItem(
-                    player_id=player.id,
                     name=item,
                     item_type="commodity",
                     quantity=quantity,
-                    value=market_prices[item],
+                    value=unit_price,
                 )
-                db.session.add(inventory_item)
-
-            db.session.commit()
+                player.inventory.append(inventory_item)
+                inventory[item] = inventory_item
 
-            return jsonify(
-                {
-                    "success": True,
-                    "message": f"Bought {quantity} {item} for {price} credits",
-                    "credits": player.credits,
-                    "inventory": [item.to_dict() for item in player.inventory],
-                }
-            )
+            return _trade_response(player, inventory, f"Bought {quantity} {item} for {price} credits")
         return jsonify(success=False, message="Insufficient credits")
 
-    elif action == "sell":
-        inventory_item = InventoryItem.query.filter_by(player_id=player.id, name=item).first()
-
-        if inventory_item and inventory_item.quantity >= quantity:
-            inventory_item.quantity -= quantity
-            player.credits += price
+    else:
+        held = inventory_item.quantity if inventory_item else 0
 
-            if inventory_item.quantity <= 0:
-                db.session.delete(inventory_item)
+        if held >= quantity:
+            inventory_item.quantity = held - quantity
+            player.credits = credits + price
 
-            db.session.commit()
+            if held == quantity:
+                player.inventory.remove(inventory_item)
+                del inventory[item]
 
-            return jsonify(
-                {
-                    "success": True,
-                    "message": f"Sold {quantity} {item} for {price} credits",
-                    "credits": player.credits,
-                    "inventory": [item.to_dict() for item in player.inventory],
-                }
-            )
+            return _trade_response(player, inventory, f"Sold {quantity} {item} for {price} credits")
         return jsonify(success=False, message="Insufficient inventory")
 
 
+def _trade_response(player: Player, inventory: dict, message: str):
+    """Build a trade's response from the already loaded inventory"""
+    # Flush first so new items have ids; commit_request_session commits
+    db.session.flush()
+    response = {
+        "success": True,
+        "message": message,
+        "credits": player.credits,
+        "inventory": [inv.to_dict() for inv in inventory.values()],
+    }
+    return jsonify(response)
+
+
 @app.route("/api/market", methods=["GET"])
 @monitor_performance
 def get_market():
@@ -1109,26 +1354,21 @@ def get_market():
     player = get_current_player()
     current_sector = player.current_sector
     
-    # Cache market data for 30 seconds (prices update periodically)
-    cache_key = f"market:{current_sector}"
+    # Keyed on the market tick so the listing matches what /api/trade charges
+    tick = market_tick()
+    cache_key = f"market:{current_sector}:{tick}"
     
-    if CACHING_AVAILABLE:
-        cached_market = cache.get(cache_key)
-        if cached_market is not None:
-            return jsonify(cached_market)
-    else:
-        cached_market = cache.get(cache_key)
-        if cached_market is not None:
-            return jsonify(cached_market)
+    cached_response = cached_json_response(cache_key)
+    if cached_response is not None:
+        return cached_response
 
     if GAME_MODULES_AVAILABLE:
-        systems = get_game_systems()
-        markets = systems["dynamic_markets"]
+        markets = get_system("dynamic_markets")
 
         if current_sector not in markets.sector_economies:
             markets.initialize_sector_economy(current_sector)
 
-        prices = markets.get_sector_prices(current_sector)
+        prices = cached_prices(markets, current_sector, tick)
         economy_info = markets.sector_economies[current_sector]
 
         # Consistent notes schema: always a list of strings
@@ -1156,32 +1396,13 @@ def get_market():
             "notes": notes,
         }
         
-        # Cache for 30 seconds
-        if CACHING_AVAILABLE:
-            cache.set(cache_key, result, timeout=30)
-        else:
-            cache.set(cache_key, result, ttl=30)
-        
-        return jsonify(result)
+        # Cache until the tick ends
+        return cache_json_response(cache_key, result, ttl=MARKET_TICK_SECONDS)
     else:
-        # Fallback static market
-        prices = {
-            "Food": 50,
-            "Iron": 100,
-            "Electronics": 300,
-            "Weapons": 800,
-            "Medicine": 400,
-            "Fuel": 75,
-        }
-        result = {"success": True, "prices": prices, "economy": {}}
-        
-        # Cache static market too
-        if CACHING_AVAILABLE:
-            cache.set(cache_key, result, timeout=300)  # Longer TTL for static data
-        else:
-            cache.set(cache_key, result, ttl=300)
+        result = {"success": True, "prices": FALLBACK_MARKET_PRICES, "economy": {}}
         
-        return jsonify(result)
+        # Cache static market too, with a longer TTL
+        return cache_json_response(cache_key, result, ttl=300)
 
 
 @app.route("/api/combat", methods=["POST"])
@@ -1199,11 +1420,8 @@ def combat():
         danger_level = min(player.current_sector // 10 + 1, 5)
         enemy_chance = danger_level * 0.2
 
-        import random
-
-        if random.random() < enemy_chance:
-            enemy_types = ["space_pirate", "alien_scout", "rogue_trader"]
-            enemy = random.choice(enemy_types)
+        if _rng.random() < enemy_chance:
+            enemy = _ENEMY_TYPES[_rng.randrange(len(_ENEMY_TYPES))]
             return jsonify(
                 {
                     "success": True,
@@ -1227,9 +1445,14 @@ def get_missions():
         return jsonify(success=True, missions=[])
 
     player = get_current_player()
+
+    cache_key = f"missions:{player.id}:{player.turn_counter}"
+    cached_response = cached_json_response(cache_key)
+    if cached_response is not None:
+        return cached_response
+
     data = get_game_data()  # Still needed for legacy mission system
-    systems = get_game_systems()
-    mission_manager = systems["mission_manager"]
+    mission_manager = get_system("mission_manager")
 
     available_missions = mission_manager.get_available_missions(
         player.level, player.current_sector, data
@@ -1253,7 +1476,7 @@ def get_missions():
             }
         )
 
-    return jsonify(success=True, missions=missions_data)
+    return cache_json_response(cache_key, {"success": True, "missions": missions_data}, ttl=5)
 
 
 @app.route("/api/save", methods=["POST"])
@@ -1278,10 +1501,10 @@ def save_game():
             return jsonify(success=False, message="No active player session"), 401
 
         data = get_game_data()
-        systems = get_game_systems()
-        save_system = systems["save_system"]
+        save_system = get_system("save_system")
 
-        # Create a GameState object
+        # Create a GameState object. The dicts are passed by reference, not
+        # copied: save_game pickles them before anything else can touch them
         game_state = GameState(
             player_data=player.to_dict(),
             world_data=data["world"],
@@ -1317,15 +1540,21 @@ def load_game():
     json_data = request.get_json() or {}
     save_name = json_data.get("save_name", "web_save")
 
-    systems = get_game_systems()
-    save_system = systems["save_system"]
+    save_system = get_system("save_system")
 
     game_state = save_system.load_game(save_name)
 
     if game_state:
         # Note: In a full implementation, this would update the database player
-        # For now, just return success - the database is the source of truth
-        return jsonify(success=True, message="Load not fully implemented in database mode")
+        # For now, the database stays the source of truth; the saved player and
+        # world are handed back as loaded (load_game unpickles fresh dicts, so
+        # there is nothing to copy) for the client's loadGame() to display
+        return jsonify(
+            success=True,
+            message="Load not fully implemented in database mode",
+            player=game_state.player_data,
+            world=game_state.world_data,
+        )
     else:
         return jsonify(success=False, message="Failed to load game")
 
@@ -1336,10 +1565,14 @@ def get_galaxy():
     player = get_current_player()
 
     # Get discovered sectors
-    discovered_sectors = [
-        v.sector_id
-        for v in SectorVisibility.query.filter_by(player_id=player.id, discovered=True).all()
-    ]
+    discovered_sectors = discovered_sector_ids(player.id)
+
+    # Discovery can change without a turn passing, but sectors are never
+    # undiscovered, so the count identifies the discovered set
+    cache_key = f"galaxy:{player.id}:{player.current_sector}:{len(discovered_sectors)}"
+    cached_response = cached_json_response(cache_key)
+    if cached_response is not None:
+        return cached_response
 
     galaxy_map = {
         "current_sector": player.current_sector,
@@ -1349,13 +1582,11 @@ def get_galaxy():
     }
 
     if GAME_MODULES_AVAILABLE:
-        systems = get_game_systems()
-        proc_gen = systems["procedural_generator"]
-
-        # Add info for discovered sectors
-        for sector_id in discovered_sectors:
-            sector_data = proc_gen.generate_galaxy_sector(sector_id)
-            galaxy_map["sectors"][sector_id] = {
+        # Add info for discovered sectors; only uncached ones are generated,
+        # in one batch
+        sector_map = get_system("sector_cache").get_many(discovered_sectors)
+        galaxy_map["sectors"] = {
+            sector_id: {
                 "name": sector_data.name,
                 "faction": sector_data.faction_control,
                 "danger_level": sector_data.danger_level,
@@ -1363,14 +1594,16 @@ def get_galaxy():
                 "planets": len(sector_data.planets),
                 "stations": len(sector_data.stations),
                 "events": len(sector_data.events),
-                "resources": list(sector_data.resources.keys()),
+                "resources": list(sector_data.resources),
                 "narrative": {
-                    "summary": getattr(sector_data, "narrative_summary", None),
-                    "hooks": getattr(sector_data, "narrative_hooks", None),
+                    "summary": sector_data.narrative_summary,
+                    "hooks": sector_data.narrative_hooks,
                 },
             }
+            for sector_id, sector_data in sector_map.items()
+        }
 
-    return jsonify(success=True, galaxy=galaxy_map)
+    return cache_json_response(cache_key, {"success": True, "galaxy": galaxy_map}, ttl=30)
 
 
 @app.route("/api/sector/<int:sector_id>", methods=["GET"])
@@ -1390,11 +1623,10 @@ def get_sector_details(sector_id):
         if not visibility or not visibility.discovered:
             return jsonify(success=False, message="Sector not yet discovered")
 
-        systems = get_game_systems()
-        proc_gen = systems["procedural_generator"]
+        generate_sector = get_system("sector_cache")
 
         # Generate detailed sector information
-        sector_data = proc_gen.generate_galaxy_sector(sector_id)
+        sector_data = generate_sector(sector_id)
 
         # Format planet information
         planets_info = []
@@ -1494,7 +1726,7 @@ def api_sector_discovery(sector_id: int):
                 db.session.add(v)
             else:
                 v.discovered = True
-            db.session.commit()
+            db.session.flush()
         # Global persistent flags
         w = World()
         if explored:
@@ -1532,9 +1764,8 @@ def scan_current_sector():
         update_fog_of_war(player, current_sector)
 
         # Get detailed sector information
-        systems = get_game_systems()
-        proc_gen = systems["procedural_generator"]
-        sector_data = proc_gen.generate_galaxy_sector(current_sector)
+        generate_sector = get_system("sector_cache")
+        sector_data = generate_sector(current_sector)
 
         # Perform scan based on player's piloting skill
         piloting_skill = player.skills.get("Piloting", 1)
@@ -1618,14 +1849,27 @@ def icons(filename):
 # ============================================================================
 
 
+def _fixed_json(**payload) -> bytes:
+    """Encode a constant response body once, as jsonify would"""
+    return f"{app.json.dumps(payload)}\n".encode()
+
+
+# Error and debug responses never change, and 404s in particular are what
+# scanners hit, so their bodies are encoded once at import
+_NOT_FOUND_BODY = _fixed_json(success=False, message="Endpoint not found")
+_INTERNAL_ERROR_BODY = _fixed_json(success=False, message="Internal server error")
+_RESET_OK_BODY = _fixed_json(success=True, message="Game state reset")
+_DEBUG_DISABLED_BODY = _fixed_json(success=False, message="Debug endpoint not available")
+
+
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify(success=False, message="Endpoint not found"), 404
+    return Response(_NOT_FOUND_BODY, 404, mimetype="application/json")
 
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify(success=False, message="Internal server error"), 500
+    return Response(_INTERNAL_ERROR_BODY, 500, mimetype="application/json")
 
 
 # ============================================================================
@@ -1638,8 +1882,8 @@ def debug_reset():
     """Reset game state (development only)"""
     if app.debug:
         session.clear()
-        return jsonify(success=True, message="Game state reset")
-    return jsonify(success=False, message="Debug endpoint not available"), 403
+        return Response(_RESET_OK_BODY, mimetype="application/json")
+    return Response(_DEBUG_DISABLED_BODY, 403, mimetype="application/json")
 
 
 @app.route("/api/debug/info")
@@ -1654,7 +1898,7 @@ def debug_info():
                 "game_systems_initialized": any(v is not None for v in game_systems.values()),
             }
         )
-    return jsonify(success=False, message="Debug endpoint not available"), 403
+    return Response(_DEBUG_DISABLED_BODY, 403, mimetype="application/json")
 
 
 @app.route("/api/performance/stats", methods=["GET"])
@@ -1702,7 +1946,6 @@ def db_check():
     try:
         # Try a simple query
         db.session.execute(text("SELECT 1"))
-        db.session.commit()
         
         # If we just reconnected, try to sync
         status = get_db_adapter_status()
@@ -1754,10 +1997,36 @@ def auto_sync_on_reconnect():
         pass  # Don't fail requests if status check fails
 
 
+@app.after_request
+def commit_request_session(response):
+    """Commit the request's unit of work once, before the response goes out"""
+    cache_writes = g.pop("cache_writes", ())
+    if response.status_code >= 500:
+        db.session.rollback()
+        return response
+    try:
+        db.session.commit()
+    except Exception as commit_error:
+        # The write was lost, so the client must not see the handler's success
+        # and its body must not be cached
+        db.session.rollback()
+        app.logger.error(f"Request commit failed: {str(commit_error)}")
+        return Response(_INTERNAL_ERROR_BODY, 500, mimetype="application/json")
+    _apply_cache_writes(cache_writes)
+    return response
+
+
+@app.teardown_request
+def end_request_session(exc):
+    """Roll back whatever an unhandled error left in the session"""
+    # Don't let the memoized player outlive the request when g is shared
+    # with an enclosing app context
+    g.pop("player", None)
+    if exc is not None:
+        db.session.rollback()
+
+
 if __name__ == "__main__":
-    import time
-    import random
-    
     # Use proper configuration
     config_name = os.environ.get('FLASK_ENV', 'development')
     from web.config import config
@@ -1777,4 +2046,9 @@ if __name__ == "__main__":
     print("API endpoints: http://localhost:5002/api/")
     print("=" * 40)
 
+    # The reloader runs this module twice; only clean up in the serving child
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_session_cleanup()
+
+    # Development server only; production runs web.wsgi:app under gunicorn
     app.run(debug=True, host="0.0.0.0", port=5002)
@@ -4,8 +4,9 @@ Caching utilities for StellarOdyssey2080 web application
 Provides in-memory caching for frequently accessed data
 """
 
+from collections import OrderedDict
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Iterable, Optional
 import time
 from threading import Lock
 
@@ -106,6 +107,69 @@ def cached(ttl: Optional[float] = None, key_prefix: str = ""):
     return decorator
 
 
+# (sector, tick) -> price dict. get_sector_prices opens the persistent sector
+# record and draws fresh variance on every call; prices hold within a market
+# tick, so every player in a sector sees and pays the same prices.
+_price_cache = {}
+_price_cache_lock = Lock()
+_PRICE_CACHE_SIZE = 512
+
+
+def cached_prices(markets, sector: int, tick: int) -> dict:
+    """Get a sector's market prices, drawing them once per sector and tick"""
+    key = (sector, tick)
+    prices = _price_cache.get(key)
+    if prices is None:
+        prices = markets.get_sector_prices(sector)
+        with _price_cache_lock:
+            _price_cache[key] = prices
+            if len(_price_cache) > _PRICE_CACHE_SIZE:
+                _price_cache.pop(next(iter(_price_cache)))
+    return prices
+
+
+class SectorCache:
+    """LRU of generated sectors that generates cache misses in one batch
+
+    Called with a sector ID it behaves like a memoized generate_galaxy_sector.
+    """
+
+    def __init__(self, generator, maxsize: int = 256):
+        self._generator = generator
+        self._maxsize = maxsize
+        self._sectors = OrderedDict()
+        self._lock = Lock()
+
+    def __call__(self, sector_id: int):
+        return self.get_many((sector_id,))[sector_id]
+
+    def get_many(self, sector_ids: Iterable[int]) -> Dict[int, Any]:
+        """Get sectors keyed by ID, in the order asked for"""
+        sector_ids = list(sector_ids)
+        found = {}
+        with self._lock:
+            for sector_id in sector_ids:
+                sector = self._sectors.get(sector_id)
+                if sector is not None:
+                    self._sectors.move_to_end(sector_id)
+                    found[sector_id] = sector
+
+        missing = [sector_id for sector_id in sector_ids if sector_id not in found]
+        if missing:
+            # Generated outside the lock; sector generation is deterministic,
+            # so a concurrent build of the same sector stores an equal result
+            built = self._generator.generate_galaxy_sectors(missing)
+            with self._lock:
+                self._sectors.update(built)
+                for sector_id in built:
+                    self._sectors.move_to_end(sector_id)
+                while len(self._sectors) > self._maxsize:
+                    self._sectors.popitem(last=False)
+            found.update(built)
+
+        return {sector_id: found[sector_id] for sector_id in sector_ids}
+
+
 def cache_key(*args, **kwargs) -> str:
     """Generate a cache key from arguments"""
     return f"{str(args)}:{str(sorted(kwargs.items()))}"
@@ -6,6 +6,14 @@ Configuration for StellarOdyssey2080 Flask application
 import os
 from pathlib import Path
 
+# SQLite databases live here; LOGDTW_DATA_DIR moves them, e.g. for tests
+DATA_DIR = os.environ.get("LOGDTW_DATA_DIR") or str(Path(__file__).resolve().parents[1] / "data" / "db")
+
+# Database connection pool. The engine in app.py and the thread limits in
+# gunicorn.conf.py both read these, so the two can't drift apart.
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 20))
+
 
 class Config:
     """Base configuration"""
@@ -22,6 +30,9 @@ class Config:
     # Flask settings
     JSON_SORT_KEYS = False
     JSONIFY_PRETTYPRINT_REGULAR = True
+    # Game state lives in the database; the session cookie only carries the
+    # session id and CSRF token, so only re-send it when those change
+    SESSION_REFRESH_EACH_REQUEST = False
 
 
 class DevelopmentConfig(Config):
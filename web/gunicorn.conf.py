@@ -0,0 +1,46 @@
+"""
+Gunicorn settings for StellarOdyssey2080 Web Server
+
+Run from the repository root:
+
+    gunicorn -c web/gunicorn.conf.py web.wsgi:app
+"""
+
+import multiprocessing
+import os
+import sys
+from pathlib import Path
+
+# gunicorn reads this file before it puts the working directory on sys.path
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from web.config import DB_MAX_OVERFLOW, DB_POOL_SIZE
+
+bind = os.environ.get("GUNICORN_BIND", f"0.0.0.0:{os.environ.get('PORT', '5000')}")
+
+# Markets, caches and generated sectors live in process memory, so each worker
+# would run its own copy of the market simulation. Scale with threads in a
+# single worker by default; WEB_CONCURRENCY adds workers when that is acceptable.
+workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+worker_class = "gthread"
+
+# Every request thread may hold a database connection. Keep the default within
+# the engine's pool_size, and any setting within pool_size plus max_overflow,
+# so threads never wait out pool_timeout for a connection.
+threads = min(
+    int(os.environ.get("GUNICORN_THREADS", min(multiprocessing.cpu_count() * 2 + 1, DB_POOL_SIZE))),
+    DB_POOL_SIZE + DB_MAX_OVERFLOW,
+)
+
+# Build the game systems once in the master before forking
+preload_app = True
+
+timeout = 30
+keepalive = 5
+
+
+def post_worker_init(worker):
+    # Threads don't survive the fork, so each worker starts its own cleanup
+    from web.app import start_session_cleanup
+
+    start_session_cleanup()
@@ -4,13 +4,14 @@ Database Models for StellarOdyssey2080 Flask Web Application
 SQLite3-based models with SQLAlchemy ORM
 """
 
+import copy
 import json
 import os
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import Column, Integer, String, Float, Boolean, Text, DateTime, ForeignKey, text
+from sqlalchemy import Column, Integer, String, Float, Boolean, Text, DateTime, ForeignKey, Index, event, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.exc import OperationalError, DisconnectionError
 from werkzeug.security import generate_password_hash, check_password_hash
@@ -250,6 +251,10 @@ class SectorVisibility(db.Model):
     """Fog of war - sector visibility tracking"""
 
     __tablename__ = "sector_visibility"
+    __table_args__ = (
+        # One row per player and sector
+        Index("uq_sector_vis_player_sector", "player_id", "sector_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True)
     player_id = Column(Integer, ForeignKey("players.id"), nullable=False)
@@ -455,14 +460,25 @@ class GameSettings(db.Model):
 
     @classmethod
     def get_setting(cls, key: str, default=None):
-        """Get a setting value"""
-        setting = cls.query.filter_by(key=key).first()
-        if setting:
-            try:
-                return json.loads(setting.value)
-            except (json.JSONDecodeError, TypeError):
-                return setting.value
-        return default
+        """Get a setting value, cached for SETTINGS_CACHE_TTL seconds"""
+        now = time.monotonic()
+        cached = _settings_cache.get(key)
+        if cached is not None and cached[1] > now:
+            value = cached[0]
+        else:
+            setting = cls.query.filter_by(key=key).first()
+            if setting:
+                try:
+                    value = json.loads(setting.value)
+                except (json.JSONDecodeError, TypeError):
+                    value = setting.value
+            else:
+                value = _MISSING_SETTING
+            _settings_cache[key] = (value, now + SETTINGS_CACHE_TTL)
+        if value is _MISSING_SETTING:
+            return default
+        # Callers get their own copy of dict and list settings
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
 
     @classmethod
     def set_setting(cls, key: str, value: Any, description: str = None):
@@ -480,7 +496,40 @@ class GameSettings(db.Model):
         if description:
             setting.description = description
 
-        db.session.commit()
+        # Written with the caller's unit of work, e.g. the request's commit
+        db.session.flush()
+        _settings_cache.pop(key, None)
+
+
+# Decoded GameSettings values by key, as (value, expires_at). set_setting()
+# drops the key in its own process; other workers pick up the change once
+# their entry expires.
+SETTINGS_CACHE_TTL = 60  # seconds
+_settings_cache: Dict[str, Any] = {}
+_MISSING_SETTING = object()
+
+
+# Applied to every new SQLite connection. WAL lets reads run alongside the
+# single writer and turns each commit into one append; synchronous=NORMAL is
+# durable under WAL except for the last commits on power loss.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+
+def _configure_sqlite_connection(dbapi_conn, connection_record):
+    """Tune a new SQLite connection for the web app's many small writes"""
+    cursor = dbapi_conn.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
 
 
 # Database utility functions
@@ -494,10 +543,11 @@ def init_database(app, enable_local_fallback: bool = True):
     if enable_local_fallback:
         try:
             from web.db_adapter import init_db_adapter
-            # Use data/db folder for local backup
-            data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "db")
-            os.makedirs(data_dir, exist_ok=True)
-            local_db_path = os.path.join(data_dir, "local_backup.db")
+            from web.config import DATA_DIR
+
+            # Local backup sits next to the main database
+            os.makedirs(DATA_DIR, exist_ok=True)
+            local_db_path = os.path.join(DATA_DIR, "local_backup.db")
             _db_adapter = init_db_adapter(db, local_db_path)
             print("✅ Database adapter initialized with local fallback")
         except Exception as e:
@@ -505,6 +555,10 @@ def init_database(app, enable_local_fallback: bool = True):
             _db_adapter = None
 
     with app.app_context():
+        # Tune SQLite before the first connection is opened
+        if db.engine.dialect.name == "sqlite":
+            event.listen(db.engine, "connect", _configure_sqlite_connection)
+
         # Create all tables
         db.create_all()
 
@@ -535,7 +589,9 @@ def init_database(app, enable_local_fallback: bool = True):
             db.session.execute(text("CREATE INDEX IF NOT EXISTS idx_sector_vis_player_id ON sector_visibility(player_id)"))
             db.session.execute(text("CREATE INDEX IF NOT EXISTS idx_sector_vis_sector_id ON sector_visibility(sector_id)"))
             db.session.execute(text("CREATE INDEX IF NOT EXISTS idx_sector_vis_player_sector ON sector_visibility(player_id, sector_id)"))
-            db.session.execute(text("CREATE INDEX IF NOT EXISTS idx_sector_vis_discovered ON sector_visibility(player_id, discovered)"))
+            # Covers discovered_sector_ids(), which reads sector_id for one player's discovered rows
+            db.session.execute(text("DROP INDEX IF EXISTS idx_sector_vis_discovered"))
+            db.session.execute(text("CREATE INDEX IF NOT EXISTS idx_sector_vis_discovered_sector ON sector_visibility(player_id, discovered, sector_id)"))
             
             # Indexes for PlayerMission table
             db.session.execute(text("CREATE INDEX IF NOT EXISTS idx_missions_player_id ON player_missions(player_id)"))
@@ -555,6 +611,15 @@ def init_database(app, enable_local_fallback: bool = True):
             print(f"Warning: could not create indexes: {e}")
             db.session.rollback()
 
+        # Older databases may already hold duplicate visibility rows, which
+        # would block the unique index; they keep the plain one above instead
+        try:
+            db.session.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS uq_sector_vis_player_sector ON sector_visibility(player_id, sector_id)"))
+            db.session.commit()
+        except Exception as e:
+            print(f"Warning: could not create unique sector visibility index: {e}")
+            db.session.rollback()
+
         # Initialize default settings
         default_settings = [
             ("max_sectors", 1000, "Maximum number of galaxy sectors"),
@@ -582,6 +647,7 @@ def init_database(app, enable_local_fallback: bool = True):
         for key, value, description in default_settings:
             if not GameSettings.query.filter_by(key=key).first():
                 GameSettings.set_setting(key, value, description)
+        db.session.commit()
 
         print("✅ Database initialized successfully")
 
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for StellarOdyssey2080 Web Server
+
+Run from the repository root with gunicorn, whose config preloads the app
+so the game systems are built once in the master and shared with workers:
+
+    gunicorn -c web/gunicorn.conf.py web.wsgi:app
+"""
+
+import os
+
+from web.app import app, warm_game_systems
+from web.config import config
+
+config_name = os.environ.get("FLASK_ENV", "production")
+app.config.from_object(config.get(config_name, config["default"]))
+
+# Build the game systems before gunicorn forks so workers share them
+warm_game_systems()